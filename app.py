@@ -1,3 +1,6 @@
+import threading
+import time
+
 import streamlit as st
 import model
 
@@ -21,6 +24,72 @@ EMOTIONS_CONFIG = {
     "disgust": {"emoji": "🤢", "color": "#27AE60", "bg": "linear-gradient(135deg, #27AE60, #2ECC71)", "message": "Take a moment to process that feeling."},
 }
 
+# All 7 emotions with example sentences
+EXAMPLES = [
+    ("😁 Joy", "I just got promoted at work and I'm so incredibly happy!"),
+    ("😢 Sadness", "I feel so alone and miss the good old days"),
+    ("😠 Anger", "I can't believe they lied to me! This is unacceptable!"),
+    ("😨 Fear", "I'm terrified about the exam results tomorrow"),
+    ("😍 Love", "I am deeply in love"),
+    ("😲 Surprise", "I am shocked by this news"),
+    ("😐 Neutral", "The meeting is scheduled for 3 PM tomorrow"),
+]
+
+
+# --- Shared model resource ---
+class ModelResource:
+    """
+    One model per server process, shared by every session and rerun.
+
+    Loading and warming up the model happens on a background thread, so the
+    page renders right away. The example sentences are scored at the same
+    time, and clicking one of them needs no forward pass.
+    """
+
+    def __init__(self):
+        self.ready = threading.Event()
+        self.error = None
+        self.example_results = {}
+        threading.Thread(target=self._warm, name="model-warmup", daemon=True).start()
+
+    def _warm(self):
+        try:
+            model.warmup()
+            texts = [text for _, text in EXAMPLES]
+            start = time.perf_counter()
+            results = model.predict_with_confidence_batch(texts)
+            latency_ms = 1000 * (time.perf_counter() - start) / len(texts)
+            self.example_results = {
+                text: (label, scores, latency_ms)
+                for text, (label, scores) in zip(texts, results)
+            }
+        except Exception as e:
+            self.error = e
+        finally:
+            self.ready.set()
+
+    def predict(self, text):
+        """Return (label, confidence scores, latency in ms, pre-scored flag)."""
+        self.ready.wait()
+        if text in self.example_results:
+            return self.example_results[text] + (True,)
+        if self.error is not None:
+            # Do not keep serving a failed warmup: the next rerun builds a new
+            # resource, and the call below retries loading for this request
+            get_model_resource.clear()
+        start = time.perf_counter()
+        label, scores = model.predict_with_confidence(text)
+        return label, scores, 1000 * (time.perf_counter() - start), False
+
+
+@st.cache_resource
+def get_model_resource():
+    return ModelResource()
+
+
+# Created by the first script run after the server starts, then reused
+model_resource = get_model_resource()
+
 # --- Custom CSS ---
 st.markdown("""
 <style>
@@ -266,22 +335,11 @@ if "input_text" not in st.session_state:
 # --- Example Buttons for All 7 Emotions ---
 st.markdown('<p class="examples-title">✨ Click an example to try it:</p>', unsafe_allow_html=True)
 
-# All 7 emotions with example sentences
-examples = [
-    ("😁 Joy", "I just got promoted at work and I'm so incredibly happy!"),
-    ("😢 Sadness", "I feel so alone and miss the good old days"),
-    ("😠 Anger", "I can't believe they lied to me! This is unacceptable!"),
-    ("😨 Fear", "I'm terrified about the exam results tomorrow"),
-    ("😍 Love", "I am deeply in love"),
-    ("😲 Surprise", "I am shocked by this news"),
-    ("😐 Neutral", "The meeting is scheduled for 3 PM tomorrow"),
-]
-
 # Create two rows: 4 buttons on first row, 3 on second
 row1_cols = st.columns(4)
 row2_cols = st.columns([1, 1, 1, 1])
 
-for i, (label, example_text) in enumerate(examples):
+for i, (label, example_text) in enumerate(EXAMPLES):
     if i < 4:
         with row1_cols[i]:
             if st.button(label, key=f"example_{i}", use_container_width=True):
@@ -308,11 +366,16 @@ if text != st.session_state.input_text:
 # --- Analyze Button ---
 analyze_clicked = st.button("🔍 Analyze Emotion", use_container_width=True)
 
+if not model_resource.ready.is_set():
+    st.caption("⏳ Loading the model in the background...")
+
 # --- Process and Display Results ---
 if analyze_clicked:
     if text and text.strip():
         with st.spinner("🧠 Analyzing emotional patterns..."):
-            label, confidence_scores = model.predict_with_confidence(text)
+            label, confidence_scores, latency_ms, pre_scored = model_resource.predict(
+                text
+            )
 
         emotion_config = EMOTIONS_CONFIG.get(label, EMOTIONS_CONFIG["neutral"])
 
@@ -350,6 +413,9 @@ if analyze_clicked:
         st.markdown(bars_html, unsafe_allow_html=True)
         st.markdown('</div>', unsafe_allow_html=True)
 
+        source = "pre-scored at startup" if pre_scored else "this request"
+        st.caption(f"⚡ Inference latency: {latency_ms:.1f} ms ({source})")
+
     else:
         st.warning("⚠️ Please enter some text to analyze.")
 
@@ -0,0 +1,263 @@
+"""
+Asyncio-native counterparts of the model.py prediction functions.
+
+Forward passes run on a dedicated inference thread, so awaiting a prediction
+never blocks the event loop. Texts from concurrent awaiters are merged into
+shared batches: a batch is sent to the model once it holds
+``max_batch_size`` texts or its oldest text has waited ``max_wait_ms``.
+At most ``max_in_flight`` texts may be queued or running; further callers
+wait for room, or get QueueFull when they ask not to wait.
+
+Example:
+    label, scores = await async_model.predict_with_confidence("so happy!")
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import model
+from config import INFERENCE_BATCH_SIZE
+
+
+class QueueFull(Exception):
+    """Raised when the predictor cannot accept more work without waiting."""
+
+
+class AsyncPredictor:
+    """
+    Batch concurrent async predictions onto one inference thread.
+
+    Args:
+        max_batch_size: Most texts scored in one forward pass
+        max_wait_ms: Longest a text waits for its batch to fill
+        max_in_flight: Most texts queued or being scored at once
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int = INFERENCE_BATCH_SIZE,
+        max_wait_ms: float = 2.0,
+        max_in_flight: int = 1024,
+    ):
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.max_in_flight = max_in_flight
+        self._pending: List[tuple] = []
+        # Requests taken off the queue and being scored right now
+        self._running: List[tuple] = []
+        self._closed = False
+        self._queued = 0
+        self._in_flight = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="emotion-inference"
+        )
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _start(self):
+        """Bind to the running loop and start the batching task once."""
+        if self._closed:
+            raise RuntimeError("AsyncPredictor is closed")
+        loop = asyncio.get_running_loop()
+        if self._task is not None:
+            if loop is not self._loop:
+                raise RuntimeError("AsyncPredictor is bound to another event loop")
+            return
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._full = asyncio.Event()
+        self._room = asyncio.Condition()
+        self._task = loop.create_task(self._run())
+
+    async def close(self):
+        """
+        Stop batching and shut down the inference thread.
+
+        Predictions still queued or running fail with RuntimeError.
+        """
+        self._closed = True
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._executor.shutdown(wait=True)
+
+    async def warmup(self):
+        """Load and warm up the model on the inference thread, off the loop."""
+        await asyncio.get_running_loop().run_in_executor(
+            self._executor, model.warmup
+        )
+
+    async def predict_proba_batch(
+        self, texts: Sequence[str], wait: bool = True
+    ) -> List[List[float]]:
+        """
+        Probabilities (ordered like EMOTIONS) for each text, in input order.
+
+        Args:
+            texts: Input texts to classify
+            wait: Wait for room when max_in_flight is reached; if False,
+                raise QueueFull instead
+        """
+        texts = list(texts)
+        if not texts:
+            return []
+        if len(texts) > self.max_in_flight:
+            raise ValueError(
+                f"At most {self.max_in_flight} texts per call, got {len(texts)}"
+            )
+        self._start()
+
+        async with self._room:
+            if self._in_flight + len(texts) > self.max_in_flight:
+                if not wait:
+                    raise QueueFull()
+                await self._room.wait_for(
+                    lambda: self._in_flight + len(texts) <= self.max_in_flight
+                )
+            if self._closed:
+                raise RuntimeError("AsyncPredictor is closed")
+            self._in_flight += len(texts)
+
+        future = self._loop.create_future()
+        self._pending.append((texts, future))
+        self._queued += len(texts)
+        self._wakeup.set()
+        if self._queued >= self.max_batch_size:
+            self._full.set()
+
+        try:
+            return await future
+        finally:
+            async with self._room:
+                self._in_flight -= len(texts)
+                self._room.notify_all()
+
+    async def predict_with_confidence_batch(
+        self, texts: Sequence[str], wait: bool = True
+    ) -> List[Tuple[str, Dict[str, float]]]:
+        """Async model.predict_with_confidence_batch."""
+        rows = await self.predict_proba_batch(texts, wait)
+        return [model._to_confidence(row) for row in rows]
+
+    async def predict_batch(self, texts: Sequence[str], wait: bool = True) -> List[str]:
+        """Async model.predict_batch."""
+        results = await self.predict_with_confidence_batch(texts, wait)
+        return [label for label, _ in results]
+
+    async def predict_with_confidence(self, text: str) -> Tuple[str, Dict[str, float]]:
+        """Async model.predict_with_confidence."""
+        return (await self.predict_with_confidence_batch([text]))[0]
+
+    async def predict(self, text: str) -> str:
+        """Async model.predict."""
+        return (await self.predict_batch([text]))[0]
+
+    def _take_batch(self):
+        """Pop whole requests from the queue until the batch is full."""
+        batch, size = [], 0
+        while self._pending:
+            texts, _ = self._pending[0]
+            if batch and size + len(texts) > self.max_batch_size:
+                break
+            batch.append(self._pending.pop(0))
+            size += len(texts)
+        self._queued -= size
+        return batch
+
+    async def _run(self):
+        """Batch until cancelled (by close() or by asyncio.run on exit)."""
+        try:
+            await self._batch_forever()
+        finally:
+            self._closed = True
+            # Nothing will score these any more; fail them instead of hanging
+            for _, future in self._running + self._pending:
+                if not future.done():
+                    future.set_exception(RuntimeError("AsyncPredictor is closed"))
+            self._running, self._pending, self._queued = [], [], 0
+            # Release the inference thread and the loop's default predictor,
+            # which would otherwise keep each other and the loop alive
+            self._executor.shutdown(wait=False)
+            if _predictors.get(self._loop) is self:
+                del _predictors[self._loop]
+
+    async def _batch_forever(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._wakeup.wait()
+            if self._queued < self.max_batch_size:
+                try:
+                    await asyncio.wait_for(self._full.wait(), self.max_wait)
+                except asyncio.TimeoutError:
+                    pass
+
+            batch = self._take_batch()
+            if self._queued < self.max_batch_size:
+                self._full.clear()
+            if not self._pending:
+                self._wakeup.clear()
+            if not batch:
+                continue
+
+            self._running = batch
+            texts = [text for request_texts, _ in batch for text in request_texts]
+            try:
+                rows = await loop.run_in_executor(
+                    self._executor,
+                    model.predict_proba_batch,
+                    texts,
+                    self.max_batch_size,
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                self._running = []
+                continue
+
+            offset = 0
+            for request_texts, future in batch:
+                if not future.done():
+                    future.set_result(rows[offset : offset + len(request_texts)])
+                offset += len(request_texts)
+            self._running = []
+
+
+# One default predictor per event loop. A predictor references its loop, so
+# entries are removed explicitly when the batching task ends, which
+# asyncio.run() triggers by cancelling leftover tasks before closing the loop.
+_predictors: Dict[asyncio.AbstractEventLoop, AsyncPredictor] = {}
+
+
+def get_predictor() -> AsyncPredictor:
+    """Return the default AsyncPredictor of the running event loop."""
+    loop = asyncio.get_running_loop()
+    predictor = _predictors.get(loop)
+    if predictor is None:
+        predictor = _predictors[loop] = AsyncPredictor()
+        # Start the task now so its cleanup runs even if only warmup() is used
+        predictor._start()
+    return predictor
+
+
+async def predict(text: str) -> str:
+    """Async model.predict on the default predictor."""
+    return await get_predictor().predict(text)
+
+
+async def predict_with_confidence(text: str) -> Tuple[str, Dict[str, float]]:
+    """Async model.predict_with_confidence on the default predictor."""
+    return await get_predictor().predict_with_confidence(text)
+
+
+async def predict_batch(texts: Sequence[str]) -> List[str]:
+    """Async model.predict_batch on the default predictor."""
+    return await get_predictor().predict_batch(texts)
+
+
+async def predict_with_confidence_batch(
+    texts: Sequence[str],
+) -> List[Tuple[str, Dict[str, float]]]:
+    """Async model.predict_with_confidence_batch on the default predictor."""
+    return await get_predictor().predict_with_confidence_batch(texts)
@@ -0,0 +1,5 @@
+"""
+Performance benchmarks.
+
+Run from the repository root with ``python -m benchmarks.<name>``.
+"""
@@ -0,0 +1,146 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Benchmarks run against a tiny, randomly initialized DistilBERT built locally
+from the text_emotions.csv vocabulary, so no network access or trained model
+is needed. Pass ``--model-dir`` to a benchmark to use a real model instead.
+"""
+
+import os
+import re
+import tempfile
+import time
+from collections import Counter
+from typing import List
+
+# Disable TensorFlow to avoid Keras conflicts
+os.environ["USE_TF"] = "0"
+os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
+
+from config import ORIGINAL_DATA_PATH, NUM_LABELS, LABEL2ID, ID2LABEL
+
+SPECIAL_TOKENS = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"]
+
+
+def load_texts(limit: int = None, column: str = "content") -> List[str]:
+    """Load benchmark texts from text_emotions.csv."""
+    import pandas as pd
+
+    df = pd.read_csv(ORIGINAL_DATA_PATH, nrows=limit)
+    return df[column].astype(str).tolist()
+
+
+def _build_vocab(vocab_size: int) -> List[str]:
+    """Build a WordPiece vocabulary from the most frequent corpus tokens."""
+    counts = Counter()
+    for text in load_texts():
+        counts.update(re.findall(r"\w+|[^\w\s]", text.lower()))
+
+    chars = sorted({ch for token in counts for ch in token})
+    words = [w for w, _ in counts.most_common(vocab_size) if w not in chars]
+    return SPECIAL_TOKENS + chars + ["##" + ch for ch in chars] + words
+
+
+def build_tiny_model(
+    dim: int = 128,
+    n_layers: int = 2,
+    n_heads: int = 2,
+    vocab_size: int = 8000,
+    seed: int = 0,
+) -> str:
+    """
+    Build (or reuse) a tiny random DistilBERT and return its directory.
+
+    The directory has the same layout as a trained MODEL_DIR, so it can be
+    passed to model.py through the EMOTION_MODEL_DIR environment variable.
+    """
+    import torch
+    from transformers import (
+        DistilBertConfig,
+        DistilBertTokenizer,
+        DistilBertForSequenceClassification,
+    )
+
+    name = f"emotion-tiny-d{dim}-l{n_layers}-h{n_heads}-v{vocab_size}-s{seed}"
+    path = os.path.join(tempfile.gettempdir(), name)
+    if os.path.exists(os.path.join(path, "config.json")):
+        return path
+
+    os.makedirs(path, exist_ok=True)
+    vocab_file = os.path.join(path, "vocab.txt")
+    with open(vocab_file, "w", encoding="utf-8") as f:
+        f.write("\n".join(_build_vocab(vocab_size)) + "\n")
+
+    tokenizer = DistilBertTokenizer(vocab_file=vocab_file)
+    tokenizer.save_pretrained(path)
+
+    torch.manual_seed(seed)
+    config = DistilBertConfig(
+        vocab_size=tokenizer.vocab_size,
+        dim=dim,
+        n_layers=n_layers,
+        n_heads=n_heads,
+        hidden_dim=4 * dim,
+        num_labels=NUM_LABELS,
+        id2label=ID2LABEL,
+        label2id=LABEL2ID,
+    )
+    DistilBertForSequenceClassification(config).save_pretrained(
+        path, safe_serialization=True
+    )
+    return path
+
+
+def use_model_dir(model_dir: str = None) -> str:
+    """
+    Point model.py at ``model_dir`` (or a tiny local model) before import.
+
+    Must be called before ``import model`` so config.MODEL_DIR picks it up.
+    """
+    model_dir = model_dir or build_tiny_model()
+    os.environ["EMOTION_MODEL_DIR"] = model_dir
+    return model_dir
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process, in megabytes."""
+    import resource
+    import sys
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_python(snippet: str, **env) -> dict:
+    """
+    Run ``snippet`` in a fresh interpreter from the repository root.
+
+    The snippet must print a JSON object as its last line of output, which
+    is returned. ``env`` entries are added to the child's environment.
+    """
+    import json
+    import subprocess
+    import sys
+
+    from config import BASE_DIR
+
+    output = subprocess.run(
+        [sys.executable, "-c", snippet],
+        cwd=BASE_DIR,
+        env=dict(os.environ, **env),
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def timed(fn, *args, repeat: int = 1, **kwargs):
+    """Return (best wall-clock seconds over ``repeat`` runs, last result)."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best, result
@@ -0,0 +1,55 @@
+"""
+Measure cold-start time of each inference backend in fresh processes.
+
+Each run starts a new Python process that imports model.py, loads the model
+and scores one text, and reports the time to first prediction and whether
+``transformers`` was imported.
+
+Usage:
+    python -m benchmarks.cold_start [--backends distilbert torchscript] [--runs 5]
+"""
+
+import argparse
+import statistics
+
+from benchmarks._common import run_python
+
+SNIPPET = """
+import json, sys, time
+start = time.perf_counter()
+import model
+imported = time.perf_counter()
+model.predict("I am so happy today")
+done = time.perf_counter()
+print(json.dumps({
+    "import_s": imported - start,
+    "first_prediction_s": done - start,
+    "transformers_imported": "transformers" in sys.modules,
+}))
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--backends", nargs="+", default=["distilbert", "torchscript"]
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'backend':<14}{'import s':>10}{'first prediction s':>20}"
+        f"{'transformers':>14}"
+    )
+    for backend in args.backends:
+        runs = [run_python(SNIPPET, EMOTION_BACKEND=backend) for _ in range(args.runs)]
+        print(
+            f"{backend:<14}"
+            f"{statistics.median(r['import_s'] for r in runs):>10.3f}"
+            f"{statistics.median(r['first_prediction_s'] for r in runs):>20.3f}"
+            f"{str(runs[-1]['transformers_imported']):>14}"
+        )
+
+
+if __name__ == "__main__":
+    main()
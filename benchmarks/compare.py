@@ -0,0 +1,53 @@
+"""
+Compare two benchmark suite result files.
+
+Usage:
+    python -m benchmarks.compare baseline.json candidate.json [--threshold 5]
+"""
+
+import argparse
+import json
+
+# Metrics where a smaller number is better; everything else is a rate
+LOWER_IS_BETTER = ("_s", "_ms", "_mb")
+
+
+def lower_is_better(metric: str) -> bool:
+    return metric.endswith(LOWER_IS_BETTER) and not metric.endswith("_per_s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=5.0,
+        help="percent change below which a metric counts as unchanged",
+    )
+    args = parser.parse_args()
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)["results"]
+    with open(args.candidate) as f:
+        candidate = json.load(f)["results"]
+
+    print(f"{'metric':<45}{'baseline':>12}{'candidate':>12}{'change':>10}")
+    for metric in sorted(set(baseline) | set(candidate)):
+        if metric not in baseline or metric not in candidate:
+            print(f"{metric:<45}{'missing in one run':>34}")
+            continue
+        before, after = baseline[metric], candidate[metric]
+        change = (after - before) / before * 100 if before else 0.0
+        better = -change if lower_is_better(metric) else change
+        verdict = ""
+        if better >= args.threshold:
+            verdict = "better"
+        elif better <= -args.threshold:
+            verdict = "WORSE"
+        print(f"{metric:<45}{before:>12.3f}{after:>12.3f}{change:>9.1f}% {verdict}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Compare DistilBERT fine-tuning time per epoch with and without dynamic padding.
+
+"fixed" pads every example to MAX_LENGTH in random order, as train_bert.py
+used to. "dynamic" pads each batch to its longest example and groups
+examples of similar length into the same batch. Runs on a tiny, locally
+initialized model, so no network access is needed.
+
+Usage:
+    python -m benchmarks.finetune_padding [--rows 2000] [--batch-size 16]
+"""
+
+import argparse
+import tempfile
+
+from benchmarks._common import build_tiny_model, timed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--model-dir", default=None)
+    args = parser.parse_args()
+
+    import pandas as pd
+    from transformers import (
+        DistilBertForSequenceClassification,
+        Trainer,
+        TrainingArguments,
+    )
+
+    from config import ORIGINAL_DATA_PATH, LABEL2ID
+    from tokenization import load_tokenizer
+    from train_bert import make_collator, tokenize_dataset
+
+    model_dir = args.model_dir or build_tiny_model()
+    tokenizer = load_tokenizer(model_dir)
+
+    df = pd.read_csv(ORIGINAL_DATA_PATH, nrows=args.rows)
+    df["label"] = df["sentiment"].map(LABEL2ID)
+    dataset = tokenize_dataset(df, tokenizer)
+
+    results = {}
+    for name, dynamic in (("fixed", False), ("dynamic", True)):
+        model = DistilBertForSequenceClassification.from_pretrained(model_dir)
+        with tempfile.TemporaryDirectory() as output_dir:
+            trainer = Trainer(
+                model=model,
+                args=TrainingArguments(
+                    output_dir=output_dir,
+                    num_train_epochs=1,
+                    per_device_train_batch_size=args.batch_size,
+                    group_by_length=dynamic,
+                    save_strategy="no",
+                    logging_strategy="no",
+                    report_to="none",
+                    seed=0,
+                ),
+                train_dataset=dataset,
+                data_collator=make_collator(tokenizer, dynamic_padding=dynamic),
+            )
+            results[name], _ = timed(trainer.train)
+
+    print(f"Examples: {len(dataset)}, batch size: {args.batch_size}")
+    for name, seconds in results.items():
+        print(f"{name:<8} {seconds:.2f}s per epoch")
+    print(f"Speedup: {results['fixed'] / results['dynamic']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Time train_model.py's grid search with and without the TF-IDF fit cache.
+
+Checks that both searches pick the same parameters and that the chosen
+models make identical predictions.
+
+Usage:
+    python -m benchmarks.grid_search [--n-jobs -1]
+"""
+
+import argparse
+import shutil
+import tempfile
+
+from benchmarks._common import timed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--n-jobs", type=int, default=-1)
+    args = parser.parse_args()
+
+    from train_model import build_search, load_split
+
+    X_train, X_test, y_train, _ = load_split()
+
+    uncached = build_search(memory=None, n_jobs=args.n_jobs, verbose=0)
+    uncached_time, _ = timed(uncached.fit, X_train, y_train)
+
+    cache_dir = tempfile.mkdtemp(prefix="tfidf-cache-")
+    try:
+        cached = build_search(memory=cache_dir, n_jobs=args.n_jobs, verbose=0)
+        cached_time, _ = timed(cached.fit, X_train, y_train)
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    same_params = uncached.best_params_ == cached.best_params_
+    uncached_pred = uncached.best_estimator_.predict(X_test)
+    cached_pred = cached.best_estimator_.predict(X_test)
+    same_predictions = (uncached_pred == cached_pred).all()
+    print(f"Without cache: {uncached_time:.1f}s")
+    print(f"With cache:    {cached_time:.1f}s "
+          f"({100 * (1 - cached_time / uncached_time):.0f}% less wall-clock time)")
+    print(f"Best params: {cached.best_params_}")
+    print(f"Same best params: {same_params}, same test predictions: {same_predictions}")
+
+
+if __name__ == "__main__":
+    main()
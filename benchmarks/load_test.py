@@ -0,0 +1,154 @@
+"""
+Load-test the micro-batching server against a locally started instance.
+
+Starts server.py in a subprocess, drives it with concurrent keep-alive
+clients and reports p50/p99 latency and requests per second.
+
+Usage:
+    python -m benchmarks.load_test [--concurrency 64] [--requests 5000]
+                                   [--max-batch-size 32] [--max-wait-ms 5]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from collections import Counter
+
+from benchmarks._common import load_texts, use_model_dir
+
+
+class Client:
+    """Minimal keep-alive HTTP/1.1 client for the /predict endpoint."""
+
+    def __init__(self, host, port):
+        self.host, self.port = host, port
+        self.reader = self.writer = None
+
+    async def request(self, method, path, payload=None):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(
+                self.host, self.port
+            )
+        body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        head = f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n"
+        self.writer.write(head.encode("latin-1") + body)
+        await self.writer.drain()
+
+        status = int((await self.reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.strip().lower() == "content-length":
+                length = int(value)
+        await self.reader.readexactly(length)
+        return status
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+async def wait_for_server(host, port, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        client = Client(host, port)
+        try:
+            if await client.request("GET", "/health") == 200:
+                return
+        except OSError:
+            await asyncio.sleep(0.2)
+        finally:
+            client.close()
+    raise RuntimeError(f"Server did not come up within {timeout}s")
+
+
+async def run_load(host, port, texts, concurrency, total, texts_per_request):
+    latencies, statuses = [], Counter()
+    remaining = iter(range(total))
+
+    async def worker():
+        client = Client(host, port)
+        try:
+            for _ in remaining:
+                batch = random.sample(texts, texts_per_request)
+                payload = {"text": batch[0]} if texts_per_request == 1 else {
+                    "texts": batch
+                }
+                start = time.perf_counter()
+                status = await client.request("POST", "/predict", payload)
+                latencies.append(time.perf_counter() - start)
+                statuses[status] += 1
+        finally:
+            client.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - start, latencies, statuses
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--texts-per-request", type=int, default=1)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-batch-size", type=int, default=32)
+    parser.add_argument("--max-wait-ms", type=float, default=5.0)
+    parser.add_argument("--max-queue", type=int, default=1024)
+    parser.add_argument("--startup-timeout", type=float, default=300.0)
+    parser.add_argument("--model-dir", default=None)
+    args = parser.parse_args()
+
+    use_model_dir(args.model_dir)
+    from config import BASE_DIR
+
+    host = "127.0.0.1"
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            os.path.join(BASE_DIR, "server.py"),
+            "--host", host,
+            "--port", str(args.port),
+            "--max-batch-size", str(args.max_batch_size),
+            "--max-wait-ms", str(args.max_wait_ms),
+            "--max-queue", str(args.max_queue),
+        ],
+        cwd=BASE_DIR,
+    )
+    try:
+        asyncio.run(wait_for_server(host, args.port, args.startup_timeout))
+        elapsed, latencies, statuses = asyncio.run(
+            run_load(
+                host,
+                args.port,
+                load_texts(5000),
+                args.concurrency,
+                args.requests,
+                args.texts_per_request,
+            )
+        )
+    finally:
+        server.terminate()
+        server.wait()
+
+    print(f"Requests: {len(latencies)} in {elapsed:.2f}s "
+          f"({len(latencies) / elapsed:,.1f} req/s), statuses: {dict(statuses)}")
+    print(f"Latency p50: {1000 * percentile(latencies, 50):.1f} ms, "
+          f"p99: {1000 * percentile(latencies, 99):.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
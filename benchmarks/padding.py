@@ -0,0 +1,73 @@
+"""
+Compare fixed max_length padding with dynamic, length-bucketed padding.
+
+Usage:
+    python -m benchmarks.padding [--rows 2000] [--batch-size 32] [--model-dir DIR]
+"""
+
+import argparse
+
+from benchmarks._common import load_texts, timed, use_model_dir
+
+
+def fixed_length_probabilities(model, texts, batch_size):
+    """The previous inference path: every batch padded to MAX_LENGTH."""
+    import torch
+
+    results, tokens = [], 0
+    for start in range(0, len(texts), batch_size):
+        batch = texts[start : start + batch_size]
+        batch = [model._minimal_clean(text) for text in batch]
+        inputs = model._tokenizer(
+            batch,
+            padding="max_length",
+            truncation=True,
+            max_length=model.MAX_LENGTH,
+            return_tensors="pt",
+        )
+        tokens += int(inputs["attention_mask"].sum())
+        inputs = {k: v.to(model._device) for k, v in inputs.items()}
+        with torch.no_grad():
+            logits = model._forward(inputs)
+        results.extend(torch.softmax(logits, dim=1).cpu().tolist())
+    return results, tokens
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--model-dir", default=None)
+    args = parser.parse_args()
+
+    use_model_dir(args.model_dir)
+    import model
+
+    texts = load_texts(args.rows)
+    model._load_model()
+    model.predict_batch(texts[: args.batch_size])  # warm up
+
+    fixed_time, (fixed, tokens) = timed(
+        fixed_length_probabilities, model, texts, args.batch_size, repeat=args.repeat
+    )
+    dynamic_time, dynamic = timed(
+        model._predict_probabilities, texts, args.batch_size, repeat=args.repeat
+    )
+
+    max_diff = max(
+        abs(a - b)
+        for fixed_row, dynamic_row in zip(fixed, dynamic)
+        for a, b in zip(fixed_row, dynamic_row)
+    )
+    print(f"Texts: {len(texts)}, real tokens: {tokens}, batch size: {args.batch_size}")
+    print(f"fixed   (max_length={model.MAX_LENGTH}): {fixed_time:.3f}s, "
+          f"{tokens / fixed_time:,.0f} tokens/s")
+    print(f"dynamic (length-bucketed):     {dynamic_time:.3f}s, "
+          f"{tokens / dynamic_time:,.0f} tokens/s")
+    print(f"Speedup: {fixed_time / dynamic_time:.2f}x, "
+          f"max probability difference: {max_diff:.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Compare fp32 and dynamic int8 quantized DistilBERT on CPU.
+
+Reports latency, throughput, memory and macro-F1 on train_bert.py's
+validation split, which the model never trained on.
+Run it against the trained model; the tiny random model only exercises the
+code path.
+
+Usage:
+    python -m benchmarks.quantization [--rows 4000] [--model-dir DIR]
+"""
+
+import argparse
+import copy
+import io
+import os
+
+from benchmarks._common import run_python, timed
+
+RSS_SNIPPET = """
+import json, model
+from benchmarks._common import peak_rss_mb
+model._load_model()
+model.predict("warm up")
+print(json.dumps({"rss_mb": peak_rss_mb()}))
+"""
+
+
+def held_out_split(rows):
+    """Return (texts, labels) for train_bert.py's validation rows."""
+    from train_bert import load_data, split_data
+
+    _, test_df = split_data(load_data())
+    test_df = test_df.head(rows)
+    return test_df["content"].astype(str).tolist(), test_df["sentiment"].tolist()
+
+
+def serialized_mb(module):
+    """Size of the model's state dict when saved, in megabytes."""
+    import torch
+
+    buffer = io.BytesIO()
+    torch.save(module.state_dict(), buffer)
+    return buffer.tell() / (1024 * 1024)
+
+
+def process_rss_mb(quantize):
+    """Peak RSS of a fresh process that loads the model and scores one text."""
+    result = run_python(RSS_SNIPPET, EMOTION_QUANTIZE="1" if quantize else "0")
+    return result["rss_mb"]
+
+
+def evaluate(model, module, texts, labels, batch_size, single_rows):
+    """Score ``texts`` with ``module`` and return its metrics."""
+    from sklearn.metrics import f1_score
+
+    model._model = module
+    cleaned = [model._minimal_clean(text) for text in texts]
+    model._score_cleaned(cleaned[:batch_size], batch_size)  # warm up
+
+    batch_time, probabilities = timed(model._score_cleaned, cleaned, batch_size)
+    predictions = [model._to_confidence(row)[0] for row in probabilities]
+
+    single_time, _ = timed(
+        lambda: [model._score_cleaned([text], 1) for text in cleaned[:single_rows]]
+    )
+    return {
+        "macro_f1": f1_score(labels, predictions, average="macro"),
+        "single_latency_ms": 1000 * single_time / single_rows,
+        "batch_throughput": len(texts) / batch_time,
+        "model_size_mb": serialized_mb(module),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=4000)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--single-rows", type=int, default=200)
+    parser.add_argument("--model-dir", default=None)
+    args = parser.parse_args()
+
+    if args.model_dir:
+        os.environ["EMOTION_MODEL_DIR"] = args.model_dir
+    os.environ["EMOTION_QUANTIZE"] = "0"
+    import torch
+    import model
+
+    model._load_model()
+    model._device = torch.device("cpu")
+    fp32 = model._model.cpu()
+    int8 = model.quantize_model(copy.deepcopy(fp32))
+
+    texts, labels = held_out_split(args.rows)
+    results = {}
+    for name, module in (("fp32", fp32), ("int8", int8)):
+        results[name] = evaluate(
+            model, module, texts, labels, args.batch_size, args.single_rows
+        )
+        results[name]["process_rss_mb"] = process_rss_mb(quantize=name == "int8")
+
+    print(f"Held-out texts: {len(texts)}")
+    print(f"{'metric':<20}{'fp32':>12}{'int8':>12}{'change':>12}")
+    for metric in results["fp32"]:
+        before, after = results["fp32"][metric], results["int8"][metric]
+        change = (after - before) / before * 100 if before else 0.0
+        print(f"{metric:<20}{before:>12.4f}{after:>12.4f}{change:>11.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Measure memory of several inference processes with and without mmap weights.
+
+Starts N processes that each load model.py and run one prediction, then
+reads /proc/<pid>/smaps_rollup (Linux only) while all of them are alive.
+With EMOTION_MMAP_WEIGHTS=1 the weights in model.safetensors are shared
+through the page cache, so the summed PSS (proportional set size: shared
+pages split between the processes using them) should grow far slower than
+N times one process.
+
+The script exits non-zero unless the mapped run really maps the weights and
+its summed PSS is below the copied run's by at least ``--min-saving`` of
+the ideal saving, (N - 1) times the size of model.safetensors.
+
+Usage:
+    python -m benchmarks.shared_weights [--processes 4] [--min-saving 0.5]
+                                        [--model-dir DIR]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+from benchmarks._common import use_model_dir
+
+SNIPPET = """
+import json, sys
+import model
+model.warmup()
+print("ready", flush=True)
+sys.stdin.readline()
+fields = {}
+with open("/proc/self/smaps_rollup") as f:
+    for line in f:
+        key, _, value = line.partition(":")
+        if value.strip().endswith("kB"):
+            fields[key] = int(value.split()[0]) / 1024
+print(json.dumps({
+    "mapped": model._weights_mapped,
+    "rss_mb": fields["Rss"],
+    "pss_mb": fields["Pss"],
+    "shared_mb": fields["Shared_Clean"] + fields["Shared_Dirty"],
+}))
+"""
+
+
+def measure(processes: int, mmap_weights: bool) -> list:
+    """Start ``processes`` loaded workers at once and return their memory."""
+    from config import BASE_DIR
+
+    env = dict(
+        os.environ,
+        EMOTION_MMAP_WEIGHTS="1" if mmap_weights else "0",
+        OMP_NUM_THREADS="1",
+    )
+    workers = [
+        subprocess.Popen(
+            [sys.executable, "-c", SNIPPET],
+            cwd=BASE_DIR,
+            env=env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        for _ in range(processes)
+    ]
+    try:
+        # Measure only once every process holds its model
+        for worker in workers:
+            if worker.stdout.readline().strip() != "ready":
+                raise RuntimeError("A worker failed to load the model")
+        for worker in workers:
+            worker.stdin.write("\n")
+            worker.stdin.flush()
+        return [json.loads(worker.stdout.readline()) for worker in workers]
+    finally:
+        for worker in workers:
+            worker.kill()
+            worker.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument(
+        "--min-saving",
+        type=float,
+        default=0.5,
+        help="Required fraction of the ideal PSS saving of mapped weights",
+    )
+    parser.add_argument("--model-dir", default=None)
+    args = parser.parse_args()
+    if args.processes < 2:
+        parser.error("--processes must be at least 2 to share anything")
+
+    model_dir = use_model_dir(args.model_dir)
+    weights_path = os.path.join(model_dir, "model.safetensors")
+    if not os.path.exists(weights_path):
+        raise SystemExit(f"No model.safetensors in {model_dir}")
+    weights_mb = os.path.getsize(weights_path) / (1024 * 1024)
+
+    print(
+        f"{'weights':<10}{'mapped':>8}{'RSS/proc MB':>13}"
+        f"{'shared/proc MB':>16}{'total PSS MB':>14}"
+    )
+    total_pss = {}
+    for mmap_weights in (False, True):
+        results = measure(args.processes, mmap_weights)
+        if any(r["mapped"] != mmap_weights for r in results):
+            raise SystemExit(
+                f"FAIL: expected mapped={mmap_weights} in every process; "
+                "check EMOTION_QUANTIZE and the device"
+            )
+        total_pss[mmap_weights] = sum(r["pss_mb"] for r in results)
+        count = len(results)
+        print(
+            f"{'mmap' if mmap_weights else 'copied':<10}"
+            f"{str(results[0]['mapped']):>8}"
+            f"{sum(r['rss_mb'] for r in results) / count:>13.1f}"
+            f"{sum(r['shared_mb'] for r in results) / count:>16.1f}"
+            f"{total_pss[mmap_weights]:>14.1f}"
+        )
+
+    saving = total_pss[False] - total_pss[True]
+    required = args.min_saving * (args.processes - 1) * weights_mb
+    print(f"PSS saving {saving:.1f} MB, required {required:.1f} MB")
+    if saving < required:
+        raise SystemExit("FAIL: mapped weights are not shared between processes")
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Measure import time and memory of the inference modules in fresh processes.
+
+Each run starts a new Python process, imports one module and reports the
+import time, the process RSS right after the import (read from /proc, so
+Linux only) and which heavy dependencies (torch, transformers, spaCy) got
+loaded along the way. With ``--warmup`` it also times the module's warmup().
+
+Usage:
+    python -m benchmarks.startup [--modules model preprocess] [--runs 5] [--warmup]
+"""
+
+import argparse
+import statistics
+
+from benchmarks._common import run_python
+
+HEAVY = ("torch", "transformers", "spacy")
+
+SNIPPET = """
+import importlib, json, sys, time
+start = time.perf_counter()
+module = importlib.import_module({module!r})
+imported = time.perf_counter()
+with open("/proc/self/statm") as f:
+    rss_mb = int(f.read().split()[1]) * {page_size} / (1024 * 1024)
+result = {{
+    "import_s": imported - start,
+    "rss_after_import_mb": rss_mb,
+    "loaded": [name for name in {heavy!r} if name in sys.modules],
+}}
+if {warmup!r}:
+    module.warmup()
+    result["warmup_s"] = time.perf_counter() - imported
+print(json.dumps(result))
+"""
+
+
+def measure_import(module: str, runs: int = 5, warmup: bool = False) -> dict:
+    """Median import time and post-import RSS of ``module`` over ``runs``."""
+    import os
+
+    snippet = SNIPPET.format(
+        module=module,
+        page_size=os.sysconf("SC_PAGE_SIZE"),
+        heavy=HEAVY,
+        warmup=warmup,
+    )
+    results = [run_python(snippet) for _ in range(runs)]
+    summary = {
+        "import_s": statistics.median(r["import_s"] for r in results),
+        "rss_after_import_mb": statistics.median(
+            r["rss_after_import_mb"] for r in results
+        ),
+        "loaded": results[-1]["loaded"],
+    }
+    if warmup:
+        summary["warmup_s"] = statistics.median(r["warmup_s"] for r in results)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--modules", nargs="+", default=["model", "preprocess"])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--warmup", action="store_true", help="Also time each module's warmup()"
+    )
+    args = parser.parse_args()
+
+    header = f"{'module':<12}{'import s':>10}{'RSS MB':>10}"
+    print(header + (f"{'warmup s':>10}" if args.warmup else "") + "  loaded")
+    for module in args.modules:
+        result = measure_import(module, args.runs, args.warmup)
+        line = (
+            f"{module:<12}{result['import_s']:>10.3f}"
+            f"{result['rss_after_import_mb']:>10.1f}"
+        )
+        if args.warmup:
+            line += f"{result['warmup_s']:>10.3f}"
+        print(f"{line}  {', '.join(result['loaded']) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
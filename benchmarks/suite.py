@@ -0,0 +1,190 @@
+"""
+Run the inference benchmark suite and write the results as JSON.
+
+Measures import time and RSS of model.py and preprocess.py, model.py cold
+start, single-text latency, batch throughput at
+several batch sizes and peak RSS on a tiny, randomly initialized DistilBERT
+built locally (no network access needed), plus preprocess.clean_text rows
+per second and best_model.pkl predict throughput on text_emotions.csv.
+Compare two result files with ``python -m benchmarks.compare``.
+
+Usage:
+    python -m benchmarks.suite [--output results.json] [--model-dir DIR]
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import traceback
+
+from benchmarks._common import load_texts, run_python, timed, use_model_dir
+
+COLD_START_SNIPPET = """
+import json, time
+start = time.perf_counter()
+import model
+model.predict("I am so happy today")
+print(json.dumps({"seconds": time.perf_counter() - start}))
+"""
+
+RSS_SNIPPET = """
+import json, model
+from benchmarks._common import load_texts, peak_rss_mb
+model.disable_cache()
+model.predict_batch(load_texts(512), batch_size=32)
+print(json.dumps({"peak_rss_mb": peak_rss_mb()}))
+"""
+
+
+def bench_startup(args):
+    from benchmarks.startup import measure_import
+
+    results = {}
+    for module in ("model", "preprocess"):
+        measured = measure_import(module, args.cold_runs)
+        results[f"{module}_import_s"] = measured["import_s"]
+        results[f"{module}_rss_after_import_mb"] = measured["rss_after_import_mb"]
+    return results
+
+
+def bench_cold_start(args):
+    runs = [run_python(COLD_START_SNIPPET)["seconds"] for _ in range(args.cold_runs)]
+    return {"cold_start_s": statistics.median(runs)}
+
+
+def bench_single_latency(args):
+    import model
+
+    model.disable_cache()
+    model.disable_disk_cache()
+    texts = load_texts(args.single_rows)
+    model.predict(texts[0])  # warm up
+
+    latencies = []
+    for text in texts:
+        start = time.perf_counter()
+        model.predict_with_confidence(text)
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return {
+        "single_latency_p50_ms": 1000 * latencies[len(latencies) // 2],
+        "single_latency_p99_ms": 1000 * latencies[int(0.99 * (len(latencies) - 1))],
+    }
+
+
+def bench_batch_throughput(args):
+    import model
+
+    model.disable_cache()
+    model.disable_disk_cache()
+    texts = load_texts(args.batch_rows)
+    model.predict_batch(texts[:64])  # warm up
+
+    results = {}
+    for batch_size in args.batch_sizes:
+        seconds, _ = timed(model.predict_proba_batch, texts, batch_size)
+        results[f"batch_throughput_bs{batch_size}_texts_per_s"] = len(texts) / seconds
+    return results
+
+
+def bench_peak_rss(args):
+    return run_python(RSS_SNIPPET)
+
+
+def bench_clean_text(args):
+    from preprocess import clean_text, clean_texts
+
+    texts = load_texts(args.clean_rows)
+    clean_text(texts[0])  # warm up
+    single, _ = timed(lambda: [clean_text(text) for text in texts])
+    batched, _ = timed(lambda: list(clean_texts(texts)))
+    return {
+        "clean_text_rows_per_s": len(texts) / single,
+        "clean_texts_rows_per_s": len(texts) / batched,
+    }
+
+
+def bench_linear_model(args):
+    import joblib
+
+    from config import LINEAR_MODEL_PATH
+    from preprocess import clean_texts
+
+    pipeline = joblib.load(LINEAR_MODEL_PATH)
+    cleaned = list(clean_texts(load_texts(args.linear_rows)))
+    seconds, _ = timed(pipeline.predict, cleaned, repeat=3)
+    return {"linear_predict_rows_per_s": len(cleaned) / seconds}
+
+
+BENCHMARKS = {
+    "startup": bench_startup,
+    "cold_start": bench_cold_start,
+    "single_latency": bench_single_latency,
+    "batch_throughput": bench_batch_throughput,
+    "peak_rss": bench_peak_rss,
+    "clean_text": bench_clean_text,
+    "linear_model": bench_linear_model,
+}
+
+
+def environment_info():
+    info = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+    for package in ("torch", "transformers", "spacy", "sklearn"):
+        try:
+            info[package] = __import__(package).__version__
+        except ImportError:
+            info[package] = None
+    try:
+        info["git_commit"] = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        info["git_commit"] = None
+    return info
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS))
+    parser.add_argument("--cold-runs", type=int, default=3)
+    parser.add_argument("--single-rows", type=int, default=200)
+    parser.add_argument("--batch-rows", type=int, default=2000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 8, 32, 128])
+    parser.add_argument("--clean-rows", type=int, default=2000)
+    parser.add_argument("--linear-rows", type=int, default=5000)
+    parser.add_argument("--model-dir", default=None)
+    args = parser.parse_args()
+
+    model_dir = use_model_dir(args.model_dir)
+    report = {"environment": environment_info(), "model_dir": model_dir}
+    report["results"], report["errors"] = {}, {}
+
+    for name in args.only or BENCHMARKS:
+        print(f"Running {name}...", file=sys.stderr)
+        try:
+            report["results"].update(BENCHMARKS[name](args))
+        except Exception:
+            # Keep going so one missing dependency does not lose the other numbers
+            report["errors"][name] = traceback.format_exc(limit=1).strip()
+            print(report["errors"][name], file=sys.stderr)
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    for metric, value in report["results"].items():
+        print(f"{metric:<45}{value:>14.3f}")
+    print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
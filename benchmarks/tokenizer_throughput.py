@@ -0,0 +1,74 @@
+"""
+Compare the pure-Python and Rust-backed DistilBERT tokenizers.
+
+Tokenizes every text in text_emotions.csv the way model.py does, reports
+tokens per second for both implementations and checks that they produce
+identical input_ids.
+
+Usage:
+    python -m benchmarks.tokenizer_throughput [--batch-size 512] [--model-dir DIR]
+"""
+
+import argparse
+
+from benchmarks._common import load_texts, timed, use_model_dir
+
+
+def tokenize_all(tokenizer, texts, batch_size, max_length):
+    input_ids = []
+    for start in range(0, len(texts), batch_size):
+        encoded = tokenizer(
+            texts[start : start + batch_size], truncation=True, max_length=max_length
+        )
+        input_ids.extend(encoded["input_ids"])
+    return input_ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=512)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--model-dir", default=None)
+    args = parser.parse_args()
+
+    model_dir = use_model_dir(args.model_dir)
+    import model
+    from config import MAX_LENGTH
+    from tokenization import load_tokenizer
+
+    texts = [model._minimal_clean(text) for text in load_texts()]
+    tokenizers = {
+        "python": load_tokenizer(model_dir, use_fast=False),
+        "fast": load_tokenizer(model_dir, use_fast=True),
+    }
+    if type(tokenizers["fast"]) is type(tokenizers["python"]):
+        print("tokenizers package not installed; only the Python tokenizer ran")
+        del tokenizers["fast"]
+
+    results = {}
+    for name, tokenizer in tokenizers.items():
+        seconds, ids = timed(
+            tokenize_all,
+            tokenizer,
+            texts,
+            args.batch_size,
+            MAX_LENGTH,
+            repeat=args.repeat,
+        )
+        tokens = sum(len(row) for row in ids)
+        results[name] = ids
+        print(f"{name:<8}{type(tokenizer).__name__:<28}{seconds:>8.3f}s "
+              f"{tokens / seconds:>14,.0f} tokens/s")
+
+    if len(results) == 2:
+        mismatched = [
+            i for i, (a, b) in enumerate(zip(results["python"], results["fast"]))
+            if a != b
+        ]
+        print(f"Texts: {len(texts)}, input_ids mismatches: {len(mismatched)}")
+        for i in mismatched[:5]:
+            print(f"  {texts[i]!r}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Measure how batch scoring throughput scales with worker processes.
+
+Usage:
+    python -m benchmarks.worker_pool [--rows 4000] [--max-workers 8]
+                                     [--threads-per-worker 1] [--model-dir DIR]
+"""
+
+import argparse
+import os
+
+from benchmarks._common import load_texts, timed, use_model_dir
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=4000)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count())
+    parser.add_argument("--threads-per-worker", type=int, default=1)
+    parser.add_argument("--model-dir", default=None)
+    args = parser.parse_args()
+
+    use_model_dir(args.model_dir)
+    from worker_pool import InferencePool
+
+    texts = load_texts(args.rows)
+    counts = sorted({1, args.max_workers} | {
+        n for n in (2, 4, 8, 16, 32, 64) if n < args.max_workers
+    })
+
+    print(f"{'workers':>8}{'texts/s':>12}{'speedup':>10}{'efficiency':>12}")
+    baseline = None
+    for workers in counts:
+        with InferencePool(workers, args.threads_per_worker) as pool:
+            pool.predict_proba_batch(texts[: workers * args.batch_size])  # warm up
+            elapsed, _ = timed(pool.predict_proba_batch, texts, args.batch_size)
+        throughput = len(texts) / elapsed
+        baseline = baseline or throughput
+        speedup = throughput / baseline
+        print(f"{workers:>8}{throughput:>12,.1f}{speedup:>9.2f}x"
+              f"{speedup / workers:>11.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Bounded in-process LRU cache for prediction results."""
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+
+def _entry_size(key: str, value: Tuple[float, ...]) -> int:
+    """Approximate memory held by one cache entry, in bytes."""
+    return (
+        sys.getsizeof(key)
+        + sys.getsizeof(value)
+        + sum(sys.getsizeof(item) for item in value)
+    )
+
+
+class LRUCache:
+    """
+    Thread-safe LRU cache bounded by entry count and approximate byte size.
+
+    The least recently used entries are evicted once either limit is exceeded.
+    Hit, miss and eviction counts are kept for monitoring.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: Optional[int] = None):
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._data = OrderedDict()  # key -> (value, size in bytes)
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> Optional[Tuple[float, ...]]:
+        """Return the cached value for ``key`` or None, updating recency."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: str, value: Tuple[float, ...]) -> None:
+        """Store ``value`` under ``key``, evicting old entries as needed."""
+        size = _entry_size(key, value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._data[key] = (value, size)
+            self._bytes += size
+
+            while len(self._data) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                _, (_, evicted_size) = self._data.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries. Counters are kept."""
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss/eviction counters and current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._data),
+                "bytes": self._bytes,
+            }
@@ -0,0 +1,128 @@
+"""
+Confidence-gated cascade of the linear and DistilBERT emotion models.
+
+Every text is first scored by the TF-IDF + LogisticRegression model in
+best_model.pkl. Only texts where its top probability is below
+``min_confidence``, or its margin over the runner-up is below
+``min_margin``, are sent to DistilBERT.
+"""
+
+import threading
+from typing import Dict, List, Sequence, Tuple
+
+import joblib
+
+from config import (
+    EMOTIONS,
+    INFERENCE_BATCH_SIZE,
+    LINEAR_MODEL_PATH,
+    CASCADE_MIN_CONFIDENCE,
+    CASCADE_MIN_MARGIN,
+)
+
+
+class LinearModel:
+    """best_model.pkl with probabilities mapped onto the EMOTIONS order."""
+
+    def __init__(self, path: str = LINEAR_MODEL_PATH):
+        self.pipeline = joblib.load(path)
+        classes = list(self.pipeline.classes_)
+        # Emotions the linear model was not trained on get probability 0
+        self._columns = [
+            classes.index(emotion) if emotion in classes else None
+            for emotion in EMOTIONS
+        ]
+
+    def predict_proba_batch(self, texts: Sequence[str]) -> List[List[float]]:
+        from preprocess import clean_texts
+
+        if not texts:
+            return []
+        probabilities = self.pipeline.predict_proba(list(clean_texts(texts)))
+        return [
+            [0.0 if col is None else float(row[col]) for col in self._columns]
+            for row in probabilities
+        ]
+
+
+def is_confident(probabilities: Sequence[float], min_confidence, min_margin) -> bool:
+    """Whether a linear prediction is sure enough to skip DistilBERT."""
+    top, runner_up = sorted(probabilities, reverse=True)[:2]
+    return top >= min_confidence and top - runner_up >= min_margin
+
+
+class CascadePredictor:
+    """
+    Predict with the linear model, escalating uncertain texts to DistilBERT.
+
+    Args:
+        min_confidence: Lowest linear top probability accepted without escalation
+        min_margin: Lowest gap between the top two linear probabilities accepted
+        linear_model_path: Pickled TF-IDF + LogisticRegression pipeline
+    """
+
+    def __init__(
+        self,
+        min_confidence: float = CASCADE_MIN_CONFIDENCE,
+        min_margin: float = CASCADE_MIN_MARGIN,
+        linear_model_path: str = LINEAR_MODEL_PATH,
+    ):
+        self.min_confidence = min_confidence
+        self.min_margin = min_margin
+        self.linear = LinearModel(linear_model_path)
+        self._lock = threading.Lock()
+        self._counts = {"linear": 0, "transformer": 0}
+
+    def predict_proba_batch(
+        self, texts: Sequence[str], batch_size: int = INFERENCE_BATCH_SIZE
+    ) -> List[List[float]]:
+        """Return probabilities (ordered like EMOTIONS) from whichever stage decided."""
+        import model
+
+        if not texts:
+            return []
+        results = self.linear.predict_proba_batch(texts)
+        escalated = [
+            i
+            for i, row in enumerate(results)
+            if not is_confident(row, self.min_confidence, self.min_margin)
+        ]
+        if escalated:
+            rows = model.predict_proba_batch([texts[i] for i in escalated], batch_size)
+            for i, row in zip(escalated, rows):
+                results[i] = row
+
+        with self._lock:
+            self._counts["linear"] += len(texts) - len(escalated)
+            self._counts["transformer"] += len(escalated)
+        return results
+
+    def predict_with_confidence_batch(
+        self, texts: Sequence[str], batch_size: int = INFERENCE_BATCH_SIZE
+    ) -> List[Tuple[str, Dict[str, float]]]:
+        """Like model.predict_with_confidence_batch, through the cascade."""
+        import model
+
+        return [
+            model._to_confidence(row)
+            for row in self.predict_proba_batch(texts, batch_size)
+        ]
+
+    def predict_with_confidence(self, text: str) -> Tuple[str, Dict[str, float]]:
+        """Like model.predict_with_confidence, through the cascade."""
+        return self.predict_with_confidence_batch([text])[0]
+
+    def predict(self, text: str) -> str:
+        """Like model.predict, through the cascade."""
+        return self.predict_with_confidence(text)[0]
+
+    def stats(self) -> Dict[str, float]:
+        """Texts handled by each stage, and the fraction sent to DistilBERT."""
+        with self._lock:
+            total = self._counts["linear"] + self._counts["transformer"]
+            return {
+                **self._counts,
+                "transformer_fraction": (
+                    self._counts["transformer"] / total if total else 0.0
+                ),
+            }
@@ -14,6 +14,45 @@ LEARNING_RATE = 2e-5
 NUM_EPOCHS = 3
 WARMUP_STEPS = 500
 
+# Inference configuration
+# "distilbert" (default), "student" (distilled model from distill.py) or
+# "torchscript" (compiled artifact from export_torchscript.py)
+MODEL_BACKEND = os.environ.get("EMOTION_BACKEND", "distilbert")
+INFERENCE_BATCH_SIZE = 32
+# Use the Rust-backed tokenizer when the tokenizers package is installed
+USE_FAST_TOKENIZER = os.environ.get("EMOTION_FAST_TOKENIZER", "1").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+# Texts tokenized together and sorted by length before being split into batches
+LENGTH_BUCKET_SIZE = 512
+# Tokens shared by consecutive windows in long-text mode
+LONG_TEXT_OVERLAP = 32
+# In-process LRU prediction cache, keyed on cleaned text (0 entries disables it)
+PREDICTION_CACHE_SIZE = int(os.environ.get("EMOTION_CACHE_SIZE", 0))
+PREDICTION_CACHE_MAX_BYTES = int(
+    os.environ.get("EMOTION_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+)
+# Dynamic int8 quantization of Linear layers for CPU inference
+QUANTIZE = os.environ.get("EMOTION_QUANTIZE", "0").lower() in ("1", "true", "yes")
+# Cascade: texts go to DistilBERT only when the linear model is less sure
+CASCADE_MIN_CONFIDENCE = float(os.environ.get("EMOTION_CASCADE_MIN_CONFIDENCE", 0.8))
+CASCADE_MIN_MARGIN = float(os.environ.get("EMOTION_CASCADE_MIN_MARGIN", 0.0))
+# Map model.safetensors read-only instead of copying weights into each process
+MMAP_WEIGHTS = os.environ.get("EMOTION_MMAP_WEIGHTS", "1").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+# Per-stage timings and counters for inference (see metrics.py)
+METRICS_ENABLED = os.environ.get("EMOTION_METRICS", "0").lower() in ("1", "true", "yes")
+# SQLite prediction cache shared across processes (unset disables it)
+DISK_CACHE_PATH = os.environ.get("EMOTION_DISK_CACHE")
+DISK_CACHE_MAX_BYTES = int(
+    os.environ.get("EMOTION_DISK_CACHE_MAX_BYTES", 512 * 1024 * 1024)
+)
+
 # Emotion labels (alphabetical order for consistent label encoding)
 EMOTIONS = [
     "anger",
@@ -30,7 +69,17 @@ LABEL2ID = {label: i for i, label in enumerate(EMOTIONS)}
 ID2LABEL = {i: label for i, label in enumerate(EMOTIONS)}
 
 # Paths
-MODEL_DIR = os.path.join(BASE_DIR, "models", "emotion_distilbert")
+MODEL_DIR = os.environ.get(
+    "EMOTION_MODEL_DIR", os.path.join(BASE_DIR, "models", "emotion_distilbert")
+)
+STUDENT_DIR = os.environ.get(
+    "EMOTION_STUDENT_DIR", os.path.join(BASE_DIR, "models", "emotion_student")
+)
+TORCHSCRIPT_DIR = os.environ.get(
+    "EMOTION_TORCHSCRIPT_DIR", os.path.join(BASE_DIR, "models", "emotion_torchscript")
+)
 DATA_DIR = os.path.join(BASE_DIR, "data")
 ORIGINAL_DATA_PATH = os.path.join(BASE_DIR, "text_emotions.csv")
+LINEAR_MODEL_PATH = os.path.join(BASE_DIR, "best_model.pkl")
 AUGMENTED_DATA_PATH = os.path.join(DATA_DIR, "text_emotions_with_neutral.csv")
+CACHE_DIR = os.environ.get("EMOTION_CACHE_DIR", os.path.join(BASE_DIR, ".cache"))
@@ -0,0 +1,192 @@
+"""
+Content-addressed on-disk caches of the preprocessed training corpora.
+
+Each entry is a ragged array: one flat values array plus an offsets array,
+both saved as .npy files and memory-mapped on load.
+
+- Cleaned texts for train_model.py are stored as UTF-8 bytes. The key
+  combines a hash of the source CSV, the cleaning rules in preprocess.py
+  and the spaCy model version.
+- Tokenized texts for train_bert.py are stored as unpadded int32 input ids.
+  The key combines the tokenizer vocabulary, MAX_LENGTH and a hash of the
+  texts.
+
+Any change to a key's inputs rebuilds that entry, and nothing else does.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from config import BASE_DIR, CACHE_DIR
+
+PREPROCESS_PATH = os.path.join(BASE_DIR, "preprocess.py")
+SPACY_MODEL = "en_core_web_sm"
+
+
+def file_digest(path: str) -> str:
+    """SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def cache_key(*parts) -> str:
+    """Combine strings into a short hexadecimal cache key."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(str(part).encode("utf-8") + b"\0")
+    return digest.hexdigest()[:32]
+
+
+def save_ragged(directory: str, values: np.ndarray, offsets: np.ndarray):
+    """
+    Atomically save a ragged array as ``values.npy`` and ``offsets.npy``.
+
+    Row ``i`` is ``values[offsets[i]:offsets[i + 1]]``.
+    """
+    parent = os.path.dirname(directory)
+    os.makedirs(parent, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(dir=parent)
+    try:
+        np.save(os.path.join(tmp_dir, "values.npy"), values)
+        np.save(os.path.join(tmp_dir, "offsets.npy"), offsets)
+        os.replace(tmp_dir, directory)
+    except OSError:
+        # Another process finished the same entry first
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        if not os.path.exists(os.path.join(directory, "offsets.npy")):
+            raise
+
+
+def load_ragged(directory: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Memory-map a ragged array saved by save_ragged, or raise FileNotFoundError."""
+    values = np.load(os.path.join(directory, "values.npy"), mmap_mode="r")
+    offsets = np.load(os.path.join(directory, "offsets.npy"), mmap_mode="r")
+    return values, offsets
+
+
+def _encode_texts(texts: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    encoded = [text.encode("utf-8") for text in texts]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    values = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return values, offsets
+
+
+def _decode_texts(values: np.ndarray, offsets: np.ndarray) -> List[str]:
+    data = values.tobytes()
+    return [
+        data[start:end].decode("utf-8")
+        for start, end in zip(offsets[:-1].tolist(), offsets[1:].tolist())
+    ]
+
+
+def clean_corpus_key(csv_path: str, column: str) -> str:
+    """Cache key for the cleaned ``column`` of ``csv_path``."""
+    from spacy.util import get_package_version
+    import spacy
+
+    return cache_key(
+        file_digest(csv_path),
+        column,
+        file_digest(PREPROCESS_PATH),
+        spacy.__version__,
+        SPACY_MODEL,
+        get_package_version(SPACY_MODEL),
+    )
+
+
+def load_clean_corpus(csv_path: str, column: str = "content", texts=None) -> List[str]:
+    """
+    Return ``column`` of ``csv_path`` cleaned by preprocess.clean_texts.
+
+    Reuses the cached result when the CSV, preprocess.py and the spaCy model
+    are unchanged; otherwise cleans the corpus and caches it.
+
+    Args:
+        csv_path: Source CSV file
+        column: Column holding the raw text
+        texts: The column's values, if already loaded (avoids re-reading)
+    """
+    directory = os.path.join(
+        CACHE_DIR, "clean_corpus", clean_corpus_key(csv_path, column)
+    )
+    try:
+        return _decode_texts(*load_ragged(directory))
+    except FileNotFoundError:
+        pass
+
+    import pandas as pd
+    from preprocess import clean_texts
+
+    if texts is None:
+        texts = pd.read_csv(csv_path, usecols=[column])[column]
+    cleaned = list(clean_texts((str(text) for text in texts), n_process=-1))
+    save_ragged(directory, *_encode_texts(cleaned))
+    return cleaned
+
+
+def texts_digest(texts: Sequence[str]) -> str:
+    """SHA-256 of a sequence of texts."""
+    digest = hashlib.sha256()
+    for text in texts:
+        digest.update(text.encode("utf-8") + b"\0")
+    return digest.hexdigest()
+
+
+def tokenizer_fingerprint(tokenizer) -> str:
+    """Identify a tokenizer by its class, casing and vocabulary."""
+    vocab = json.dumps(sorted(tokenizer.get_vocab().items()))
+    return cache_key(
+        type(tokenizer).__name__,
+        tokenizer.init_kwargs.get("do_lower_case"),
+        hashlib.sha256(vocab.encode("utf-8")).hexdigest(),
+    )
+
+
+def load_tokenized_corpus(
+    texts: Sequence[str], tokenizer, max_length: int, batch_size: int = 1000
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return unpadded, truncated input ids for ``texts`` as a ragged array.
+
+    Row ``i`` is ``values[offsets[i]:offsets[i + 1]]``; both arrays are
+    memory-mapped from the cache, which is built on first use.
+
+    Args:
+        texts: Raw texts to tokenize
+        tokenizer: HuggingFace tokenizer
+        max_length: Truncation length in tokens
+        batch_size: Texts per tokenizer call while building the cache
+    """
+    key = cache_key(tokenizer_fingerprint(tokenizer), max_length, texts_digest(texts))
+    directory = os.path.join(CACHE_DIR, "tokenized", key)
+    try:
+        return load_ragged(directory)
+    except FileNotFoundError:
+        pass
+
+    chunks, lengths = [], []
+    for start in range(0, len(texts), batch_size):
+        encoded = tokenizer(
+            list(texts[start : start + batch_size]),
+            truncation=True,
+            max_length=max_length,
+        )["input_ids"]
+        for ids in encoded:
+            chunks.append(np.asarray(ids, dtype=np.int32))
+            lengths.append(len(ids))
+
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    values = np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.int32)
+    save_ragged(directory, values, offsets)
+    return load_ragged(directory)
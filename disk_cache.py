@@ -0,0 +1,193 @@
+"""
+Persistent prediction cache shared by all processes on a host.
+
+Results are stored in a SQLite database in WAL mode, so Streamlit and worker
+processes can read and write it concurrently. Keys hash the cleaned text
+together with a fingerprint of the model files, so retraining the model
+invalidates every cached entry automatically.
+"""
+
+import hashlib
+import os
+import sqlite3
+import struct
+import threading
+import time
+from typing import Dict, Iterable, Tuple
+
+# How many inserts happen between two checks of the database size
+_EVICT_CHECK_INTERVAL = 256
+# Fraction of the size budget to free when the database grows past it
+_EVICT_FRACTION = 0.1
+# SQLite caps the number of bound parameters per statement
+_MAX_PARAMS = 500
+
+
+def directory_fingerprint(path: str) -> str:
+    """Hash the names, sizes and modification times of all files under ``path``."""
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            full_path = os.path.join(root, name)
+            stat = os.stat(full_path)
+            rel_path = os.path.relpath(full_path, path)
+            digest.update(f"{rel_path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def _chunks(items, size):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+class DiskCache:
+    """
+    SQLite-backed, size-bounded cache of probability vectors.
+
+    Each thread (and each forked process) gets its own connection. When the
+    live data grows past ``max_bytes`` the least recently used entries are
+    deleted and their pages reused.
+    """
+
+    def __init__(self, path: str, max_bytes: int, namespace: str = ""):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.namespace = namespace
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._inserts = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS predictions ("
+                " key BLOB PRIMARY KEY,"
+                " probs BLOB NOT NULL,"
+                " accessed REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS predictions_accessed"
+                " ON predictions (accessed)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection, reconnecting after a fork."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _key(self, text: str) -> bytes:
+        return hashlib.sha256(f"{self.namespace}\0{text}".encode("utf-8")).digest()
+
+    def get_many(self, texts: Iterable[str]) -> Dict[str, Tuple[float, ...]]:
+        """Return cached probability vectors for whichever ``texts`` are present."""
+        keys = {self._key(text): text for text in texts}
+        if not keys:
+            return {}
+
+        conn = self._connect()
+        found = {}
+        for chunk in _chunks(list(keys), _MAX_PARAMS):
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT key, probs FROM predictions WHERE key IN ({placeholders})",
+                chunk,
+            ).fetchall()
+            for key, blob in rows:
+                found[keys[key]] = struct.unpack(f"<{len(blob) // 8}d", blob)
+
+        if found:
+            now = time.time()
+            found_keys = [key for key, text in keys.items() if text in found]
+            with conn:
+                for chunk in _chunks(found_keys, _MAX_PARAMS):
+                    placeholders = ",".join("?" * len(chunk))
+                    conn.execute(
+                        "UPDATE predictions SET accessed = ?"
+                        f" WHERE key IN ({placeholders})",
+                        [now, *chunk],
+                    )
+
+        with self._lock:
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, items: Dict[str, Tuple[float, ...]]) -> None:
+        """Store probability vectors, evicting old entries if over budget."""
+        if not items:
+            return
+
+        now = time.time()
+        rows = [
+            (self._key(text), struct.pack(f"<{len(probs)}d", *probs), now)
+            for text, probs in items.items()
+        ]
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO predictions (key, probs, accessed)"
+                " VALUES (?, ?, ?)",
+                rows,
+            )
+
+        with self._lock:
+            self._inserts += len(rows)
+            check = self._inserts >= _EVICT_CHECK_INTERVAL
+            if check:
+                self._inserts = 0
+        if check:
+            self._evict(conn)
+
+    def _used_bytes(self, conn: sqlite3.Connection) -> int:
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        return (page_count - free_pages) * page_size
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Delete least recently used entries until under the size budget."""
+        used = self._used_bytes(conn)
+        if used <= self.max_bytes:
+            return
+
+        total = conn.execute("SELECT COUNT(*) FROM predictions").fetchone()[0]
+        excess = (used - self.max_bytes) / used + _EVICT_FRACTION
+        count = max(1, int(total * min(excess, 1.0)))
+        with conn:
+            cursor = conn.execute(
+                "DELETE FROM predictions WHERE key IN ("
+                " SELECT key FROM predictions ORDER BY accessed LIMIT ?)",
+                (count,),
+            )
+        with self._lock:
+            self.evictions += cursor.rowcount
+
+    def clear(self) -> None:
+        """Delete every entry from the database."""
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM predictions")
+
+    def stats(self) -> Dict[str, int]:
+        """Return this process's hit/miss/eviction counters and database size."""
+        conn = self._connect()
+        entries = conn.execute("SELECT COUNT(*) FROM predictions").fetchone()[0]
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": entries,
+                "bytes": self._used_bytes(conn),
+            }
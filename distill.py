@@ -0,0 +1,191 @@
+"""
+Distill the DistilBERT classifier into a small student model.
+
+The teacher (model.py) labels its own training data and any extra unlabelled
+text with soft probabilities. The student from student.py is trained on
+those soft labels (plus the gold labels where available), saved next to a
+copy of the teacher's tokenizer, and compared with the teacher on
+train_bert.py's validation split, which the teacher never trained on.
+
+Usage:
+    python distill.py [--unlabelled train.csv:Tweet] [--epochs 5]
+
+Serve the student with EMOTION_BACKEND=student.
+"""
+
+import argparse
+import os
+import time
+
+# Disable TensorFlow to avoid Keras conflicts
+os.environ["USE_TF"] = "0"
+os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
+# The teacher is always the DistilBERT backend
+os.environ["EMOTION_BACKEND"] = "distilbert"
+
+import numpy as np
+import pandas as pd
+import torch
+import torch.nn.functional as F
+from sklearn.metrics import accuracy_score, f1_score
+
+import model
+from config import EMOTIONS, MAX_LENGTH, NUM_LABELS, STUDENT_DIR
+from student import StudentClassifier, save_student
+from train_bert import load_data, split_data
+
+
+def load_texts(args):
+    """Return (train_df, test_df, unlabelled texts) split like train_bert.py."""
+    df = load_data()
+    df["content"] = df["content"].astype(str)
+    train_df, test_df = split_data(df)
+
+    unlabelled = []
+    for spec in args.unlabelled:
+        path, _, column = spec.partition(":")
+        texts = pd.read_csv(path, usecols=[column or "content"]).iloc[:, 0]
+        unlabelled.extend(texts.dropna().astype(str).tolist())
+    return train_df, test_df, unlabelled
+
+
+def soften(probabilities: np.ndarray, temperature: float) -> np.ndarray:
+    """Equivalent to softmax(logits / T), computed from the probabilities."""
+    scaled = np.power(np.clip(probabilities, 1e-12, 1.0), 1.0 / temperature)
+    return scaled / scaled.sum(axis=1, keepdims=True)
+
+
+def encode(texts):
+    """Clean and tokenize texts like model.py does, without padding."""
+    cleaned = [model._minimal_clean(text) for text in texts]
+    return model._tokenizer(cleaned, truncation=True, max_length=MAX_LENGTH)[
+        "input_ids"
+    ]
+
+
+def train_student(encoded, soft_targets, hard_labels, args):
+    """
+    Train the student on teacher soft labels, adding gold labels where known.
+
+    ``hard_labels`` holds -1 for unlabelled rows.
+    """
+    torch.manual_seed(0)
+    pad_token_id = model._tokenizer.pad_token_id
+    student = StudentClassifier(
+        vocab_size=len(model._tokenizer),
+        num_labels=NUM_LABELS,
+        dim=args.dim,
+        hidden=args.hidden,
+        pad_token_id=pad_token_id,
+    )
+    optimizer = torch.optim.AdamW(student.parameters(), lr=args.learning_rate)
+    targets = torch.tensor(soft_targets, dtype=torch.float32)
+    labels = torch.tensor(hard_labels, dtype=torch.long)
+
+    for epoch in range(args.epochs):
+        student.train()
+        order = torch.randperm(len(encoded)).tolist()
+        total_loss = 0.0
+        for start in range(0, len(order), args.batch_size):
+            indices = order[start : start + args.batch_size]
+            input_ids, attention_mask = model.pad_batch(
+                [encoded[i] for i in indices], pad_token_id
+            )
+            logits = student(input_ids, attention_mask)
+
+            log_probs = F.log_softmax(logits / args.temperature, dim=1)
+            loss = F.kl_div(log_probs, targets[indices], reduction="batchmean")
+            loss = loss * args.temperature**2
+            batch_labels = labels[indices]
+            if (batch_labels >= 0).any():
+                hard_loss = F.cross_entropy(logits, batch_labels, ignore_index=-1)
+                loss = (1 - args.alpha) * loss + args.alpha * hard_loss
+
+            optimizer.zero_grad()
+            loss.backward()
+            optimizer.step()
+            total_loss += loss.item() * len(indices)
+        print(f"Epoch {epoch + 1}/{args.epochs}: loss {total_loss / len(order):.4f}")
+
+    student.eval()
+    return student
+
+
+def evaluate(module, texts, labels, batch_size):
+    """Score ``texts`` with ``module`` through model.py; return metrics."""
+    model._model = module
+    cleaned = [model._minimal_clean(text) for text in texts]
+    model._score_cleaned(cleaned[:batch_size], batch_size)  # warm up
+
+    start = time.perf_counter()
+    probabilities = model._score_cleaned(cleaned, batch_size)
+    elapsed = time.perf_counter() - start
+
+    predictions = [int(np.argmax(row)) for row in probabilities]
+    return {
+        "accuracy": accuracy_score(labels, predictions),
+        "f1_macro": f1_score(labels, predictions, average="macro"),
+        "texts_per_second": len(texts) / elapsed,
+        "parameters": sum(p.numel() for p in module.parameters()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Distill DistilBERT into a student")
+    parser.add_argument(
+        "--unlabelled",
+        action="append",
+        default=[],
+        metavar="CSV[:COLUMN]",
+        help="extra text for the teacher to label, e.g. train.csv:Tweet",
+    )
+    parser.add_argument("--output-dir", default=STUDENT_DIR)
+    parser.add_argument("--epochs", type=int, default=5)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--learning-rate", type=float, default=2e-3)
+    parser.add_argument("--temperature", type=float, default=2.0)
+    parser.add_argument("--alpha", type=float, default=0.3)
+    parser.add_argument("--dim", type=int, default=128)
+    parser.add_argument("--hidden", type=int, default=256)
+    args = parser.parse_args()
+
+    train_df, test_df, unlabelled = load_texts(args)
+    train_texts = train_df["content"].tolist() + unlabelled
+    hard_labels = train_df["label"].tolist() + [-1] * len(unlabelled)
+
+    print(f"Labelling {len(train_texts)} texts with the teacher...")
+    model._load_model()
+    teacher = model._model
+    soft_targets = soften(
+        np.array(model.predict_proba_batch(train_texts)), args.temperature
+    )
+
+    print("Training student...")
+    student = train_student(encode(train_texts), soft_targets, hard_labels, args)
+
+    save_student(student, args.output_dir)
+    model._tokenizer.save_pretrained(args.output_dir)
+    print(f"Saved student to {args.output_dir}")
+
+    # Compare both models on CPU, through the same inference path
+    model._device = torch.device("cpu")
+    test_texts, test_labels = test_df["content"].tolist(), test_df["label"].tolist()
+    report = {
+        "teacher": evaluate(teacher.cpu(), test_texts, test_labels, 32),
+        "student": evaluate(student, test_texts, test_labels, 32),
+    }
+
+    print(f"\nHeld-out texts: {len(test_texts)} (labels: {EMOTIONS})")
+    print(f"{'':<10}{'accuracy':>10}{'f1_macro':>10}{'texts/s':>12}{'params':>14}")
+    for name, metrics in report.items():
+        print(
+            f"{name:<10}{metrics['accuracy']:>10.4f}{metrics['f1_macro']:>10.4f}"
+            f"{metrics['texts_per_second']:>12,.0f}{metrics['parameters']:>14,}"
+        )
+    student_speed = report["student"]["texts_per_second"]
+    speedup = student_speed / report["teacher"]["texts_per_second"]
+    print(f"Student is {speedup:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Export the emotion model as a traced TorchScript artifact for fast cold starts.
+
+Writes ``model.pt`` (traced module returning logits), ``tokenizer.json``
+(tokenizers-library file) and ``export_info.json`` to TORCHSCRIPT_DIR, then
+checks that the artifact reproduces the eager model's predictions on
+text_emotions.csv. Serve it with EMOTION_BACKEND=torchscript.
+
+Usage:
+    python export_torchscript.py [--output-dir DIR] [--check-rows 512]
+"""
+
+import argparse
+import json
+import os
+
+# Disable TensorFlow to avoid Keras conflicts
+os.environ["USE_TF"] = "0"
+os.environ["TF_CPP_MIN_LOG_LEVEL"] = "3"
+if os.environ.get("EMOTION_BACKEND") == "torchscript":
+    raise SystemExit("Export from the distilbert or student backend, not torchscript")
+
+import pandas as pd
+import torch
+
+import model
+from config import MAX_LENGTH, MODEL_BACKEND, ORIGINAL_DATA_PATH, TORCHSCRIPT_DIR
+from torchscript_runtime import INFO_NAME, MODEL_NAME, TOKENIZER_NAME, load_artifact
+
+# Largest allowed difference between eager and traced probabilities
+TOLERANCE = 1e-4
+
+
+class LogitsOnly(torch.nn.Module):
+    """Wrap a classifier so tracing sees plain (input_ids, attention_mask) -> logits."""
+
+    def __init__(self, module):
+        super().__init__()
+        self.module = module
+
+    def forward(self, input_ids, attention_mask):
+        outputs = self.module(input_ids, attention_mask)
+        return outputs.logits if hasattr(outputs, "logits") else outputs
+
+
+def save_tokenizer_file(path: str):
+    """Write the model's tokenizer as a tokenizers-library JSON file."""
+    from transformers import DistilBertTokenizerFast
+
+    fast = DistilBertTokenizerFast.from_pretrained(model._model_dir())
+    fast.backend_tokenizer.save(path)
+
+
+def check_artifact(output_dir: str, texts):
+    """Compare artifact and eager predictions on batches of several shapes."""
+    scripted, tokenizer, _ = load_artifact(output_dir, torch.device("cpu"))
+    cleaned = [model._minimal_clean(text) for text in texts]
+
+    eager_ids = model._encode(cleaned)
+    script_ids = tokenizer(cleaned, truncation=True, max_length=MAX_LENGTH)["input_ids"]
+    mismatched = sum(a != b for a, b in zip(eager_ids, script_ids))
+    if mismatched:
+        raise RuntimeError(f"tokenizer.json disagrees on {mismatched} texts")
+
+    max_diff, disagreements = 0.0, 0
+    for batch_size in (1, 7, 32):
+        for start in range(0, len(eager_ids), batch_size):
+            inputs = model._collate(eager_ids[start : start + batch_size])
+            with torch.no_grad():
+                eager = torch.softmax(model._forward(inputs), dim=1)
+                traced = torch.softmax(
+                    scripted(inputs["input_ids"], inputs["attention_mask"]), dim=1
+                )
+            max_diff = max(max_diff, (eager - traced).abs().max().item())
+            disagreements += (eager.argmax(1) != traced.argmax(1)).sum().item()
+
+    print(f"Max probability difference: {max_diff:.2e}, "
+          f"label disagreements: {disagreements}")
+    if max_diff > TOLERANCE or disagreements:
+        raise RuntimeError("Traced artifact is not equivalent to the eager model")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export a TorchScript artifact")
+    parser.add_argument("--output-dir", default=TORCHSCRIPT_DIR)
+    parser.add_argument("--check-rows", type=int, default=512)
+    args = parser.parse_args()
+
+    model._load_model()
+    model._model.cpu()
+    model._device = torch.device("cpu")
+
+    texts = pd.read_csv(ORIGINAL_DATA_PATH, nrows=args.check_rows)["content"]
+    texts = texts.astype(str).tolist()
+    example = model._collate(model._encode(texts[:4]))
+
+    wrapper = LogitsOnly(model._model).eval()
+    with torch.no_grad():
+        traced = torch.jit.trace(
+            wrapper,
+            (example["input_ids"], example["attention_mask"]),
+            check_trace=False,
+            strict=False,
+        )
+    traced = torch.jit.freeze(traced)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    traced.save(os.path.join(args.output_dir, MODEL_NAME))
+    save_tokenizer_file(os.path.join(args.output_dir, TOKENIZER_NAME))
+    with open(os.path.join(args.output_dir, INFO_NAME), "w") as f:
+        json.dump(
+            {
+                "source_backend": MODEL_BACKEND,
+                "quantized": model.QUANTIZE,
+                "max_length": MAX_LENGTH,
+                "torch_version": torch.__version__,
+            },
+            f,
+            indent=2,
+        )
+    try:
+        check_artifact(args.output_dir, texts)
+    except RuntimeError:
+        # Without export_info.json the torchscript backend refuses to load it
+        os.remove(os.path.join(args.output_dir, INFO_NAME))
+        raise
+    print(f"Saved TorchScript artifact to {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""
+Low-overhead inference metrics with pluggable hooks and a Prometheus exporter.
+
+Stage timings, counters and histograms are recorded only while metrics are
+enabled (EMOTION_METRICS=1 or ``enable()``). When disabled, ``stage()``
+returns a shared no-op context manager and ``inc`` / ``observe`` return
+after one flag check, so instrumented code pays close to nothing.
+
+Example:
+    with metrics.stage("forward"):
+        logits = model(**inputs)
+    metrics.inc("texts_total", len(texts))
+    print(metrics.render_prometheus())
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, List
+
+from config import METRICS_ENABLED
+
+PREFIX = "emotion_"
+STAGE_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+HISTOGRAM_BUCKETS = {"batch_size": (1, 2, 4, 8, 16, 32, 64, 128, 256, 512)}
+
+_enabled = METRICS_ENABLED
+_lock = threading.Lock()
+_counters: Dict[str, float] = {}
+# name -> [bucket counts..., +Inf count], sum
+_histograms: Dict[str, list] = {}
+_stages: Dict[str, list] = {}
+_hooks: List[Callable[[str, str, float], None]] = []
+_collectors: List[Callable[[], Dict[str, float]]] = []
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _StageTimer:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        _record(_stages, self.name, elapsed, STAGE_BUCKETS)
+        _notify("stage", self.name, elapsed)
+        return False
+
+
+def enable():
+    """Start recording metrics."""
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """Stop recording metrics. Recorded values are kept."""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset():
+    """Drop all recorded values."""
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+        _stages.clear()
+
+
+def add_hook(hook: Callable[[str, str, float], None]):
+    """
+    Call ``hook(kind, name, value)`` for every recorded event.
+
+    ``kind`` is "counter", "histogram" or "stage" (value in seconds). Hooks
+    run inline on the hot path, so they should be cheap.
+    """
+    _hooks.append(hook)
+
+
+def remove_hook(hook: Callable[[str, str, float], None]):
+    _hooks.remove(hook)
+
+
+def register_collector(collector: Callable[[], Dict[str, float]]):
+    """Add a function returning gauge values to include in every export."""
+    _collectors.append(collector)
+
+
+def stage(name: str):
+    """Context manager timing one pipeline stage; a no-op while disabled."""
+    if not _enabled:
+        return _NULL_STAGE
+    return _StageTimer(name)
+
+
+def inc(name: str, value: float = 1):
+    """Add ``value`` to a counter."""
+    if not _enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + value
+    _notify("counter", name, value)
+
+
+def observe(name: str, value: float):
+    """Record one observation in a histogram."""
+    if not _enabled:
+        return
+    _record(_histograms, name, value, HISTOGRAM_BUCKETS.get(name, STAGE_BUCKETS))
+    _notify("histogram", name, value)
+
+
+def _record(store, name, value, buckets):
+    with _lock:
+        entry = store.get(name)
+        if entry is None:
+            entry = store[name] = [[0] * (len(buckets) + 1), 0.0, buckets]
+        entry[0][bisect_left(buckets, value)] += 1
+        entry[1] += value
+
+
+def _notify(kind, name, value):
+    for hook in _hooks:
+        hook(kind, name, value)
+
+
+def snapshot() -> Dict[str, dict]:
+    """Return a copy of all counters, histograms, stage timings and gauges."""
+    with _lock:
+        counters = dict(_counters)
+        histograms = {
+            name: {"count": sum(counts), "sum": total}
+            for name, (counts, total, _) in _histograms.items()
+        }
+        stages = {
+            name: {"count": sum(counts), "sum_seconds": total}
+            for name, (counts, total, _) in _stages.items()
+        }
+    gauges = {}
+    for collector in _collectors:
+        gauges.update(collector())
+    return {
+        "counters": counters,
+        "histograms": histograms,
+        "stages": stages,
+        "gauges": gauges,
+    }
+
+
+def _histogram_lines(metric, label, name, counts, total, buckets):
+    labels = f'{label}="{name}",' if label else ""
+    lines, cumulative = [], 0
+    for bound, count in zip(list(buckets) + ["+Inf"], counts):
+        cumulative += count
+        lines.append(f'{metric}_bucket{{{labels}le="{bound}"}} {cumulative}')
+    selector = f'{{{label}="{name}"}}' if label else ""
+    lines.append(f"{metric}_sum{selector} {total}")
+    lines.append(f"{metric}_count{selector} {cumulative}")
+    return lines
+
+
+def render_prometheus() -> str:
+    """Render all metrics in the Prometheus text exposition format."""
+    with _lock:
+        counters = dict(_counters)
+        histograms = {k: (list(v[0]), v[1], v[2]) for k, v in _histograms.items()}
+        stages = {k: (list(v[0]), v[1], v[2]) for k, v in _stages.items()}
+    gauges = {}
+    for collector in _collectors:
+        gauges.update(collector())
+
+    lines = []
+    for name, value in sorted(counters.items()):
+        lines += [f"# TYPE {PREFIX}{name} counter", f"{PREFIX}{name} {value}"]
+    for name, value in sorted(gauges.items()):
+        lines += [f"# TYPE {PREFIX}{name} gauge", f"{PREFIX}{name} {value}"]
+    for name, (counts, total, buckets) in sorted(histograms.items()):
+        lines.append(f"# TYPE {PREFIX}{name} histogram")
+        lines += _histogram_lines(PREFIX + name, None, name, counts, total, buckets)
+    if stages:
+        metric = f"{PREFIX}stage_seconds"
+        lines.append(f"# TYPE {metric} histogram")
+        for name, (counts, total, buckets) in sorted(stages.items()):
+            lines += _histogram_lines(metric, "stage", name, counts, total, buckets)
+    return "\n".join(lines) + "\n"
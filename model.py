@@ -3,14 +3,42 @@ Emotion detection model inference module.
 
 Supports DistilBERT transformer model with automatic device detection.
 Downloads model from HuggingFace Hub if not available locally.
+Set EMOTION_BACKEND=student to serve the distilled student from distill.py,
+or EMOTION_BACKEND=torchscript to serve the compiled artifact from
+export_torchscript.py without importing transformers.
+
+Importing this module is cheap: torch, transformers and the model weights
+load on first use, or up front with warmup().
 """
 
 import os
 import re
-import torch
-from typing import Dict, Tuple
-
-from config import MODEL_DIR, EMOTIONS, MAX_LENGTH
+import threading
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import metrics
+from cache import LRUCache
+from disk_cache import DiskCache, directory_fingerprint
+from config import (
+    MODEL_DIR,
+    STUDENT_DIR,
+    TORCHSCRIPT_DIR,
+    MODEL_BACKEND,
+    EMOTIONS,
+    MAX_LENGTH,
+    INFERENCE_BATCH_SIZE,
+    LENGTH_BUCKET_SIZE,
+    LONG_TEXT_OVERLAP,
+    PREDICTION_CACHE_SIZE,
+    PREDICTION_CACHE_MAX_BYTES,
+    DISK_CACHE_PATH,
+    DISK_CACHE_MAX_BYTES,
+    QUANTIZE,
+    MMAP_WEIGHTS,
+)
+
+if TYPE_CHECKING:
+    import torch
 
 # HuggingFace Hub repository for the model
 HF_REPO_ID = "xploit007/emotion-detection-distilbert"
@@ -19,10 +47,23 @@ HF_REPO_ID = "xploit007/emotion-detection-distilbert"
 _model = None
 _tokenizer = None
 _device = None
+_cache = (
+    LRUCache(PREDICTION_CACHE_SIZE, PREDICTION_CACHE_MAX_BYTES)
+    if PREDICTION_CACHE_SIZE > 0
+    else None
+)
+_disk_cache = None
+_disk_cache_disabled = False
+# True when the weights are views of a read-only mmap of model.safetensors
+_weights_mapped = False
+# Guards one-time initialization of the globals above
+_load_lock = threading.RLock()
 
 
 def _get_device():
     """Determine the best available device."""
+    import torch
+
     if torch.cuda.is_available():
         return torch.device("cuda")
     elif hasattr(torch.backends, "mps") and torch.backends.mps.is_available():
@@ -54,64 +95,527 @@ def _download_model_from_hub():
     print("Model downloaded successfully!")
 
 
-def _load_model():
-    """Load the model and tokenizer into memory."""
-    global _model, _tokenizer, _device
+# Backend -> (directory, file that must exist, script that creates it)
+_LOCAL_BACKENDS = {
+    "student": (STUDENT_DIR, "student_config.json", "distill.py"),
+    "torchscript": (TORCHSCRIPT_DIR, "export_info.json", "export_torchscript.py"),
+}
 
-    if _model is not None:
+
+def _model_dir() -> str:
+    """Directory holding the files of the configured backend."""
+    if MODEL_BACKEND in _LOCAL_BACKENDS:
+        return _LOCAL_BACKENDS[MODEL_BACKEND][0]
+    return MODEL_DIR
+
+
+def _ensure_model_files():
+    """Download the model from HuggingFace Hub if it is not available locally."""
+    if MODEL_BACKEND in _LOCAL_BACKENDS:
+        directory, required, script = _LOCAL_BACKENDS[MODEL_BACKEND]
+        if not os.path.exists(os.path.join(directory, required)):
+            raise FileNotFoundError(
+                f"No {MODEL_BACKEND} model in {directory}. Run 'python {script}' first."
+            )
         return
+    if MODEL_BACKEND != "distilbert":
+        raise ValueError(f"Unknown EMOTION_BACKEND: {MODEL_BACKEND}")
 
-    # Check if model exists locally, if not download from HuggingFace
     model_config_path = os.path.join(MODEL_DIR, "config.json")
     if not os.path.exists(model_config_path):
         os.makedirs(MODEL_DIR, exist_ok=True)
         _download_model_from_hub()
 
-    # Import here to avoid slow startup if model not needed
-    from transformers import (
-        DistilBertTokenizer,
-        DistilBertForSequenceClassification,
+
+def _load_model():
+    """
+    Load the model and tokenizer into memory.
+
+    Safe to call from several threads at once: the model is loaded exactly
+    once, and _model is published last, after it is fully ready.
+    """
+    global _model, _tokenizer, _device, _weights_mapped
+
+    if _model is not None:
+        return
+
+    with _load_lock:
+        if _model is not None:
+            return
+
+        _ensure_model_files()
+        import torch
+
+        if MODEL_BACKEND == "torchscript":
+            from torchscript_runtime import load_artifact
+
+            # Traced on the CPU; quantization, if any, was applied at export time
+            device = torch.device("cpu")
+            module, tokenizer, _ = load_artifact(TORCHSCRIPT_DIR, device)
+        else:
+            # Import here to avoid slow startup if model not needed
+            from transformers import DistilBertForSequenceClassification
+            from tokenization import load_tokenizer
+
+            # Quantized kernels only run on the CPU
+            device = torch.device("cpu") if QUANTIZE else _get_device()
+
+            tokenizer = load_tokenizer(_model_dir())
+            if MODEL_BACKEND == "student":
+                from student import load_student
+
+                module = load_student(STUDENT_DIR)
+            elif _can_map_weights(device):
+                module = _load_mapped_distilbert(MODEL_DIR)
+                _weights_mapped = True
+            else:
+                module = DistilBertForSequenceClassification.from_pretrained(
+                    MODEL_DIR
+                )
+            module.eval()
+            if QUANTIZE:
+                module = quantize_model(module)
+            module.to(device)
+
+        _device, _tokenizer = device, tokenizer
+        _model = module
+
+
+# safetensors dtype names -> torch dtype names
+_SAFETENSORS_DTYPES = {
+    "F64": "float64",
+    "F32": "float32",
+    "F16": "float16",
+    "BF16": "bfloat16",
+    "I64": "int64",
+    "I32": "int32",
+    "I16": "int16",
+    "I8": "int8",
+    "U8": "uint8",
+    "BOOL": "bool",
+}
+
+
+def _safetensors_path(model_dir: str = MODEL_DIR) -> str:
+    return os.path.join(model_dir, "model.safetensors")
+
+
+def _can_map_weights(device) -> bool:
+    """
+    Whether to serve the weights straight from a memory map.
+
+    Quantizing or moving to a GPU copies every weight anyway, so mapping
+    would only mislabel private weights as shared.
+    """
+    return (
+        MMAP_WEIGHTS
+        and not QUANTIZE
+        and device.type == "cpu"
+        and os.path.exists(_safetensors_path())
     )
 
-    _device = _get_device()
 
-    _tokenizer = DistilBertTokenizer.from_pretrained(MODEL_DIR)
-    _model = DistilBertForSequenceClassification.from_pretrained(MODEL_DIR)
-    _model.to(_device)
-    _model.eval()
+def _mmap_safetensors(path: str) -> Dict[str, "torch.Tensor"]:
+    """
+    Open a safetensors file as tensors backed by a read-only memory map.
 
+    Nothing is copied: the tensors point into the page cache, so every
+    process that maps the same file shares one physical copy of the weights.
+    Writing to the tensors in place would crash, so they are for inference
+    only.
+    """
+    import json
+    import mmap
+    import struct
+    import warnings
+
+    import torch
+
+    with open(path, "rb") as f:
+        (header_size,) = struct.unpack("<Q", f.read(8))
+        header = json.loads(f.read(header_size))
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    data_start = 8 + header_size
+
+    tensors = {}
+    with warnings.catch_warnings():
+        # frombuffer warns that the buffer is read-only, which is intended
+        warnings.simplefilter("ignore", UserWarning)
+        for name, info in header.items():
+            if name == "__metadata__":
+                continue
+            dtype = getattr(torch, _SAFETENSORS_DTYPES[info["dtype"]])
+            begin, end = info["data_offsets"]
+            if begin == end:
+                tensors[name] = torch.empty(info["shape"], dtype=dtype)
+                continue
+            item_size = torch.empty((), dtype=dtype).element_size()
+            tensors[name] = torch.frombuffer(
+                mapped,
+                dtype=dtype,
+                count=(end - begin) // item_size,
+                offset=data_start + begin,
+            ).reshape(info["shape"])
+    return tensors
+
+
+def _load_mapped_distilbert(model_dir: str):
+    """Build the DistilBERT classifier around memory-mapped safetensors weights."""
+    from transformers import DistilBertConfig, DistilBertForSequenceClassification
+    from transformers.modeling_utils import no_init_weights
+
+    config = DistilBertConfig.from_pretrained(model_dir)
+    # Every parameter is replaced below, so skip random initialization
+    with no_init_weights():
+        module = DistilBertForSequenceClassification(config)
+
+    path = _safetensors_path(model_dir)
+    # assign=True swaps in the mapped tensors instead of copying into the
+    # freshly allocated ones, which are then freed
+    missing, _ = module.load_state_dict(
+        _mmap_safetensors(path), strict=False, assign=True
+    )
+    if missing:
+        raise ValueError(f"{path} is missing weights: {', '.join(missing[:5])}")
+    return module
 
-def predict(text: str) -> str:
+
+def warmup():
     """
-    Predict the emotion label for the given text.
+    Load the model and run one forward pass.
+
+    Servers call this at startup so the first request does not pay for
+    importing torch, loading weights and initializing kernels.
+    """
+    _load_model()
+    _score_cleaned(["warmup"], 1)
+
+
+def quantize_model(module: "torch.nn.Module") -> "torch.nn.Module":
+    """
+    Apply dynamic int8 quantization to the Linear layers of a model.
+
+    Weights are stored as int8 and activations are quantized on the fly,
+    which shrinks the model and speeds up CPU inference.
 
     Args:
-        text: Input text to classify
+        module: fp32 model in eval mode
 
     Returns:
-        Predicted emotion label (one of 7 emotions)
+        Quantized copy of the model (CPU only)
+    """
+    import torch
+
+    return torch.ao.quantization.quantize_dynamic(
+        module.cpu(), {torch.nn.Linear}, dtype=torch.qint8
+    )
+
+
+def _encode(texts: List[str]) -> List[List[int]]:
+    """Tokenize cleaned texts into truncated, unpadded input id lists."""
+    with metrics.stage("tokenize"):
+        encoded = _tokenizer(texts, truncation=True, max_length=MAX_LENGTH)
+    if metrics.is_enabled():
+        # Texts that reach the limit were (almost always) cut short
+        at_limit = sum(len(ids) >= MAX_LENGTH for ids in encoded["input_ids"])
+        metrics.inc("truncated_texts_total", at_limit)
+    return encoded["input_ids"]
+
+
+def pad_batch(
+    batch_ids: List[List[int]], pad_token_id: int
+) -> Tuple["torch.Tensor", "torch.Tensor"]:
+    """
+    Pad input id lists to the longest one, on the CPU.
+
+    Returns:
+        Tuple of (input_ids, attention_mask) long tensors
+    """
+    import torch
+
+    width = max(len(ids) for ids in batch_ids)
+    input_ids = torch.full((len(batch_ids), width), pad_token_id, dtype=torch.long)
+    attention_mask = torch.zeros((len(batch_ids), width), dtype=torch.long)
+    for row, ids in enumerate(batch_ids):
+        input_ids[row, : len(ids)] = torch.tensor(ids, dtype=torch.long)
+        attention_mask[row, : len(ids)] = 1
+    return input_ids, attention_mask
+
+
+def _collate(batch_ids: List[List[int]]) -> Dict[str, "torch.Tensor"]:
+    """Pad a batch of input id lists to its longest member only."""
+    input_ids, attention_mask = pad_batch(batch_ids, _tokenizer.pad_token_id)
+    with metrics.stage("to_device"):
+        return {
+            "input_ids": input_ids.to(_device),
+            "attention_mask": attention_mask.to(_device),
+        }
+
+
+def _forward(inputs: Dict[str, "torch.Tensor"]) -> "torch.Tensor":
+    """Run the loaded model and return its logits."""
+    # Positional, so traced TorchScript modules accept the same call
+    outputs = _model(inputs["input_ids"], inputs["attention_mask"])
+    # HuggingFace models wrap logits in an output object; the others do not
+    return outputs.logits if hasattr(outputs, "logits") else outputs
+
+
+def _score_cleaned(texts: List[str], batch_size: int) -> List[List[float]]:
+    """
+    Score already-cleaned texts with the model.
+
+    Texts are tokenized LENGTH_BUCKET_SIZE at a time, sorted by token length
+    and split into batches of ``batch_size``, so each forward pass only pads
+    to the longest text in its batch. Results come back in input order.
     """
     _load_model()
+    import torch
 
-    # Preprocess
-    clean_text = _minimal_clean(text)
+    results: List[List[float]] = [None] * len(texts)
+    bucket_size = max(LENGTH_BUCKET_SIZE, batch_size)
+    for bucket_start in range(0, len(texts), bucket_size):
+        encoded = _encode(texts[bucket_start : bucket_start + bucket_size])
+        order = sorted(range(len(encoded)), key=lambda i: len(encoded[i]))
+
+        for start in range(0, len(order), batch_size):
+            indices = order[start : start + batch_size]
+            metrics.observe("batch_size", len(indices))
+            inputs = _collate([encoded[i] for i in indices])
+
+            # On GPU the forward pass runs asynchronously; its time shows up
+            # in "postprocess", where .cpu() waits for the result
+            with torch.no_grad(), metrics.stage("forward"):
+                logits = _forward(inputs)
+
+            with metrics.stage("postprocess"):
+                rows = torch.softmax(logits, dim=1).cpu().tolist()
+            for i, row in zip(indices, rows):
+                results[bucket_start + i] = row
+
+    return results
+
+
+def _predict_probabilities(
+    texts: Sequence[str], batch_size: int = INFERENCE_BATCH_SIZE
+) -> List[List[float]]:
+    """
+    Run the model over many texts and return per-class probabilities.
+
+    Texts are cleaned first; duplicates and texts already in the in-process
+    or on-disk prediction cache skip tokenization and the forward pass.
+
+    Args:
+        texts: Input texts to classify
+        batch_size: Number of texts per forward pass
+
+    Returns:
+        One list of probabilities (ordered like EMOTIONS) per input text
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+    metrics.inc("requests_total")
+    metrics.inc("texts_total", len(texts))
+    with metrics.stage("clean"):
+        cleaned = [_minimal_clean(text) for text in texts]
+    cache, disk_cache = _cache, _get_disk_cache()
+
+    known: Dict[str, Tuple[float, ...]] = {}
+    if cache is not None:
+        for key in set(cleaned):
+            probabilities = cache.get(key)
+            if probabilities is not None:
+                known[key] = probabilities
+        metrics.inc("cache_memory_hits_total", len(known))
+
+    missing = [key for key in dict.fromkeys(cleaned) if key not in known]
+    if missing and disk_cache is not None:
+        found = disk_cache.get_many(missing)
+        if cache is not None:
+            for key, probabilities in found.items():
+                cache.put(key, probabilities)
+        known.update(found)
+        metrics.inc("cache_disk_hits_total", len(found))
+        missing = [key for key in missing if key not in found]
+
+    if missing:
+        metrics.inc("scored_texts_total", len(missing))
+        scored = {
+            key: tuple(row)
+            for key, row in zip(missing, _score_cleaned(missing, batch_size))
+        }
+        if cache is not None:
+            for key, probabilities in scored.items():
+                cache.put(key, probabilities)
+        if disk_cache is not None:
+            disk_cache.put_many(scored)
+        known.update(scored)
+
+    return [list(known[key]) for key in cleaned]
+
+
+def enable_cache(
+    max_entries: int = PREDICTION_CACHE_SIZE or 10000,
+    max_bytes: Optional[int] = PREDICTION_CACHE_MAX_BYTES,
+):
+    """
+    Enable (or resize) the in-process LRU prediction cache.
+
+    Args:
+        max_entries: Maximum number of cached texts
+        max_bytes: Approximate memory budget in bytes, or None for no limit
+    """
+    global _cache
+    _cache = LRUCache(max_entries, max_bytes)
+
+
+def disable_cache():
+    """Disable the in-process prediction cache and drop its contents."""
+    global _cache
+    _cache = None
 
-    # Tokenize
-    inputs = _tokenizer(
-        clean_text,
-        padding="max_length",
-        truncation=True,
-        max_length=MAX_LENGTH,
-        return_tensors="pt",
-    )
-    inputs = {k: v.to(_device) for k, v in inputs.items()}
 
-    # Inference
-    with torch.no_grad():
-        outputs = _model(**inputs)
-        prediction = torch.argmax(outputs.logits, dim=1).item()
+def cache_stats() -> Dict[str, int]:
+    """Return hit/miss/eviction counters of the prediction cache."""
+    if _cache is None:
+        return {}
+    return _cache.stats()
 
-    return EMOTIONS[prediction]
+
+def _model_fingerprint() -> str:
+    """Identify the model files, so retraining invalidates cached predictions."""
+    _ensure_model_files()
+    precision = "int8" if QUANTIZE else "fp32"
+    return f"{MODEL_BACKEND}:{directory_fingerprint(_model_dir())}:{precision}"
+
+
+def _get_disk_cache() -> Optional[DiskCache]:
+    """Return the on-disk cache, opening the configured one on first use."""
+    global _disk_cache
+    if _disk_cache is None and DISK_CACHE_PATH and not _disk_cache_disabled:
+        with _load_lock:
+            if _disk_cache is None and not _disk_cache_disabled:
+                enable_disk_cache(DISK_CACHE_PATH, DISK_CACHE_MAX_BYTES)
+    return _disk_cache
+
+
+def enable_disk_cache(
+    path: str = DISK_CACHE_PATH, max_bytes: int = DISK_CACHE_MAX_BYTES
+):
+    """
+    Enable the SQLite prediction cache shared by all processes on this host.
+
+    Args:
+        path: Database file; processes pointing at the same file share results
+        max_bytes: Size budget after which least recently used entries go
+    """
+    global _disk_cache, _disk_cache_disabled
+    if not path:
+        raise ValueError("A path is required to enable the disk cache")
+    _disk_cache_disabled = False
+    _disk_cache = DiskCache(path, max_bytes, namespace=_model_fingerprint())
+
+
+def disable_disk_cache():
+    """Stop using the on-disk prediction cache. The database is kept."""
+    global _disk_cache, _disk_cache_disabled
+    _disk_cache = None
+    _disk_cache_disabled = True
+
+
+def disk_cache_stats() -> Dict[str, int]:
+    """Return this process's counters and the size of the on-disk cache."""
+    if _disk_cache is None:
+        return {}
+    return _disk_cache.stats()
+
+
+def _cache_gauges() -> Dict[str, float]:
+    """Expose the prediction caches' own counters through metrics.py."""
+    gauges = {}
+    for layer, stats in (("memory", cache_stats()), ("disk", disk_cache_stats())):
+        for name, value in stats.items():
+            gauges[f"cache_{layer}_{name}"] = value
+    return gauges
+
+
+metrics.register_collector(_cache_gauges)
+
+
+def _to_confidence(probabilities: List[float]) -> Tuple[str, Dict[str, float]]:
+    """Convert a probability vector into (label, {emotion: percentage})."""
+    confidence_scores = {
+        emotion: round(prob * 100, 2) for emotion, prob in zip(EMOTIONS, probabilities)
+    }
+    predicted_idx = max(range(len(probabilities)), key=probabilities.__getitem__)
+    return EMOTIONS[predicted_idx], confidence_scores
+
+
+def predict_batch(
+    texts: Sequence[str], batch_size: int = INFERENCE_BATCH_SIZE
+) -> List[str]:
+    """
+    Predict emotion labels for many texts at once.
+
+    Args:
+        texts: Input texts to classify
+        batch_size: Number of texts per forward pass
+
+    Returns:
+        Predicted emotion labels, in the same order as ``texts``
+    """
+    return [
+        _to_confidence(probabilities)[0]
+        for probabilities in _predict_probabilities(texts, batch_size)
+    ]
+
+
+def predict_with_confidence_batch(
+    texts: Sequence[str], batch_size: int = INFERENCE_BATCH_SIZE
+) -> List[Tuple[str, Dict[str, float]]]:
+    """
+    Predict emotions with confidence scores for many texts at once.
+
+    Args:
+        texts: Input texts to classify
+        batch_size: Number of texts per forward pass
+
+    Returns:
+        List of (predicted_label, {emotion: confidence}), in input order
+    """
+    return [
+        _to_confidence(probabilities)
+        for probabilities in _predict_probabilities(texts, batch_size)
+    ]
+
+
+def predict_proba_batch(
+    texts: Sequence[str], batch_size: int = INFERENCE_BATCH_SIZE
+) -> List[List[float]]:
+    """
+    Predict unrounded class probabilities for many texts at once.
+
+    Args:
+        texts: Input texts to classify
+        batch_size: Number of texts per forward pass
+
+    Returns:
+        One list of probabilities (ordered like EMOTIONS) per input text
+    """
+    return _predict_probabilities(texts, batch_size)
+
+
+def predict(text: str) -> str:
+    """
+    Predict the emotion label for the given text.
+
+    Args:
+        text: Input text to classify
+
+    Returns:
+        Predicted emotion label (one of 7 emotions)
+    """
+    return predict_batch([text])[0]
 
 
 def predict_with_confidence(text: str) -> Tuple[str, Dict[str, float]]:
@@ -124,29 +628,117 @@ def predict_with_confidence(text: str) -> Tuple[str, Dict[str, float]]:
     Returns:
         Tuple of (predicted_label, {emotion: confidence})
     """
+    return predict_with_confidence_batch([text])[0]
+
+
+AGGREGATIONS = ("mean", "max", "weighted")
+
+
+def _windows(ids: List[int], overlap: int) -> Iterator[Tuple[List[int], int]]:
+    """
+    Yield overlapping windows of content token ids, each wrapped in [CLS]/[SEP].
+
+    Windows hold up to MAX_LENGTH - 2 content tokens and consecutive windows
+    share ``overlap`` tokens. The last window is aligned to the end of the text,
+    so it may share more. Each window comes with the number of tokens it adds
+    that no earlier window covered.
+    """
+    size = MAX_LENGTH - 2
+    step = size - overlap
+    wrap = [_tokenizer.cls_token_id], [_tokenizer.sep_token_id]
+
+    start, covered = 0, 0
+    while True:
+        end = min(start + size, len(ids))
+        yield wrap[0] + ids[start:end] + wrap[1], end - covered
+        if end >= len(ids):
+            return
+        covered = end
+        start = min(start + step, len(ids) - size)
+
+
+def _long_probabilities(
+    text: str, aggregate: str, overlap: int, batch_size: int
+) -> List[float]:
+    """Score every window of ``text`` and combine their probabilities."""
+    if aggregate not in AGGREGATIONS:
+        raise ValueError(f"aggregate must be one of {AGGREGATIONS}, got {aggregate!r}")
+    if not 0 <= overlap < MAX_LENGTH - 2:
+        raise ValueError(f"overlap must be in [0, {MAX_LENGTH - 2}), got {overlap}")
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+
     _load_model()
+    import torch
+
+    ids = _tokenizer(_minimal_clean(text), add_special_tokens=False)["input_ids"]
+
+    # Running aggregates keep memory bounded by one batch of windows
+    total, maximum, weight = None, None, 0.0
+    windows = _windows(ids, overlap)
+    while True:
+        batch, new_tokens = [], []
+        for _, (window, added) in zip(range(batch_size), windows):
+            batch.append(window)
+            new_tokens.append(added)
+        if not batch:
+            break
+
+        with torch.no_grad():
+            probabilities = torch.softmax(_forward(_collate(batch)), dim=1).cpu()
+
+        if aggregate == "weighted":
+            # Tokens shared with earlier windows count only once
+            weights = torch.tensor(new_tokens, dtype=probabilities.dtype).clamp(min=1)
+        else:
+            weights = torch.ones(len(batch), dtype=probabilities.dtype)
+
+        batch_total = (probabilities * weights.unsqueeze(1)).sum(dim=0)
+        batch_max = probabilities.max(dim=0).values
+        total = batch_total if total is None else total + batch_total
+        maximum = batch_max if maximum is None else torch.maximum(maximum, batch_max)
+        weight += weights.sum().item()
+
+    if aggregate == "max":
+        return (maximum / maximum.sum()).tolist()
+    return (total / weight).tolist()
+
+
+def predict_with_confidence_long(
+    text: str,
+    aggregate: str = "mean",
+    overlap: int = LONG_TEXT_OVERLAP,
+    batch_size: int = INFERENCE_BATCH_SIZE,
+) -> Tuple[str, Dict[str, float]]:
+    """
+    Predict emotion with confidence scores for text longer than MAX_LENGTH.
 
-    clean_text = _minimal_clean(text)
+    The text is split into overlapping windows of MAX_LENGTH tokens, the
+    windows are scored in batches and their probabilities are combined.
 
-    inputs = _tokenizer(
-        clean_text,
-        padding="max_length",
-        truncation=True,
-        max_length=MAX_LENGTH,
-        return_tensors="pt",
-    )
-    inputs = {k: v.to(_device) for k, v in inputs.items()}
+    Args:
+        text: Input text of any length
+        aggregate: "mean" (average over windows), "max" (per-emotion maximum,
+            renormalized) or "weighted" (average weighted by the tokens
+            each window adds beyond the previous ones)
+        overlap: Tokens shared by consecutive windows
+        batch_size: Windows per forward pass
 
-    with torch.no_grad():
-        outputs = _model(**inputs)
-        probabilities = torch.softmax(outputs.logits, dim=1)[0]
+    Returns:
+        Tuple of (predicted_label, {emotion: confidence})
+    """
+    return _to_confidence(_long_probabilities(text, aggregate, overlap, batch_size))
 
-    confidence_scores = {
-        emotion: round(prob.item() * 100, 2)
-        for emotion, prob in zip(EMOTIONS, probabilities)
-    }
 
-    predicted_idx = torch.argmax(probabilities).item()
-    predicted_label = EMOTIONS[predicted_idx]
+def predict_long(
+    text: str,
+    aggregate: str = "mean",
+    overlap: int = LONG_TEXT_OVERLAP,
+    batch_size: int = INFERENCE_BATCH_SIZE,
+) -> str:
+    """
+    Predict the emotion label for text longer than MAX_LENGTH.
 
-    return predicted_label, confidence_scores
+    See predict_with_confidence_long for the arguments.
+    """
+    return predict_with_confidence_long(text, aggregate, overlap, batch_size)[0]
@@ -1,16 +1,68 @@
+"""
+Text cleaning for the classical models.
+
+spaCy and its English model load on first use (or with warmup()), so
+importing this module stays cheap.
+"""
+
 import re
-import spacy
+import threading
+from typing import Iterable, Iterator
 
-nlp = spacy.load("en_core_web_sm", disable=["ner", "parser"])
+_nlp = None
+_nlp_lock = threading.Lock()
 
+URL_RE = re.compile(r"http\S+|www\S+")
+MENTION_HASHTAG_RE = re.compile(r"@\w+|#\w+")
+NON_ALNUM_RE = re.compile(r"[^a-z0-9\s]")
 
-def clean_text(text: str) -> str:
+
+def _get_nlp():
+    """Load the spaCy pipeline once, on first use."""
+    global _nlp
+    if _nlp is None:
+        with _nlp_lock:
+            if _nlp is None:
+                import spacy
+
+                _nlp = spacy.load("en_core_web_sm", disable=["ner", "parser"])
+    return _nlp
+
+
+def __getattr__(name):
+    # Keeps ``preprocess.nlp`` working without loading spaCy at import time
+    if name == "nlp":
+        return _get_nlp()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def warmup():
+    """Load spaCy now instead of on the first call to clean_text."""
+    _get_nlp()
+
+
+def _normalize(text: str) -> str:
     text = text.lower()
-    text = re.sub(r"http\S+|www\S+", "", text)
-    text = re.sub(r"@\w+|#\w+", "", text)
-    text = re.sub(r"[^a-z0-9\s]", " ", text)
-    doc = nlp(text)
+    text = URL_RE.sub("", text)
+    text = MENTION_HASHTAG_RE.sub("", text)
+    return NON_ALNUM_RE.sub(" ", text)
+
+
+def _lemmas(doc) -> str:
     tokens = [
         token.lemma_ for token in doc if not token.is_stop and token.lemma_.isalnum()
     ]
     return " ".join(tokens)
+
+
+def clean_text(text: str) -> str:
+    return _lemmas(_get_nlp()(_normalize(text)))
+
+
+def clean_texts(
+    texts: Iterable[str], batch_size: int = 1000, n_process: int = 1
+) -> Iterator[str]:
+    """Clean many texts with nlp.pipe; yields the same output as clean_text."""
+    normalized = (_normalize(text) for text in texts)
+    for doc in _get_nlp().pipe(normalized, batch_size=batch_size, n_process=n_process):
+        yield _lemmas(doc)
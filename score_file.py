@@ -0,0 +1,205 @@
+"""
+Score a large CSV or JSONL file with the emotion model.
+
+The input is streamed in chunks, so it never has to fit in memory. Each
+chunk is scored with batched inference and appended to the output together
+with the predicted label and one probability column per emotion. Progress is
+checkpointed after every chunk; rerunning the same command resumes after a
+crash.
+
+Usage:
+    python score_file.py text_emotions.csv scored.csv --text-column content
+    python score_file.py train.csv scored.jsonl --text-column Tweet
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import pandas as pd
+
+from config import EMOTIONS, INFERENCE_BATCH_SIZE
+
+
+def _file_format(path: str) -> str:
+    """Infer 'csv' or 'jsonl' from a file extension."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".jsonl", ".json", ".ndjson"):
+        return "jsonl"
+    raise ValueError(f"Unsupported file type '{extension}', use .csv or .jsonl")
+
+
+def read_chunks(path: str, chunk_size: int):
+    """Yield DataFrame chunks of a CSV or JSONL file."""
+    if _file_format(path) == "csv":
+        return pd.read_csv(path, chunksize=chunk_size)
+    return pd.read_json(path, lines=True, chunksize=chunk_size)
+
+
+def serialize_chunk(chunk: pd.DataFrame, fmt: str, header: bool) -> bytes:
+    """Render a scored chunk in the output format."""
+    if fmt == "csv":
+        return chunk.to_csv(index=False, header=header).encode("utf-8")
+    data = chunk.to_json(orient="records", lines=True, force_ascii=False)
+    return (data if data.endswith("\n") else data + "\n").encode("utf-8")
+
+
+def load_checkpoint(path: str) -> dict:
+    """Read the resume checkpoint, or return an empty one."""
+    if not os.path.exists(path):
+        return {"rows_done": 0, "output_bytes": 0}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_checkpoint(path: str, checkpoint: dict):
+    """Write the checkpoint atomically so a crash never leaves it half-written."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, path)
+
+
+def score_chunk(chunk: pd.DataFrame, text_column: str, predict_proba, batch_size):
+    """Return ``chunk`` with a label column and one probability column per emotion."""
+    texts = chunk[text_column].fillna("").astype(str).tolist()
+    probabilities = predict_proba(texts, batch_size)
+
+    scored = chunk.copy()
+    scored["label"] = [
+        EMOTIONS[max(range(len(row)), key=row.__getitem__)] for row in probabilities
+    ]
+    for i, emotion in enumerate(EMOTIONS):
+        scored[f"prob_{emotion}"] = [row[i] for row in probabilities]
+    return scored
+
+
+def score_file(
+    input_path: str,
+    output_path: str,
+    text_column: str,
+    chunk_size: int = 1000,
+    batch_size: int = INFERENCE_BATCH_SIZE,
+    restart: bool = False,
+    predict_proba=None,
+):
+    """
+    Stream ``input_path`` through the model into ``output_path``.
+
+    Args:
+        input_path: CSV or JSONL file to score
+        output_path: CSV or JSONL file to write (format from its extension)
+        text_column: Column holding the text to classify
+        chunk_size: Rows read, scored and written per step
+        batch_size: Texts per forward pass
+        restart: Ignore an existing checkpoint and start over
+        predict_proba: Scoring function, defaults to model.predict_proba_batch
+    """
+    if predict_proba is None:
+        import model
+
+        predict_proba = model.predict_proba_batch
+
+    output_format = _file_format(output_path)
+    checkpoint_path = output_path + ".ckpt"
+    source = {"input": os.path.abspath(input_path), "text_column": text_column}
+    checkpoint = {"rows_done": 0, "output_bytes": 0}
+    if not restart:
+        checkpoint = load_checkpoint(checkpoint_path)
+        if checkpoint["rows_done"] and checkpoint.get("source") != source:
+            raise ValueError(
+                f"{checkpoint_path} belongs to a different input; use --restart"
+            )
+    rows_done = checkpoint["rows_done"]
+
+    if rows_done:
+        print(f"Resuming after {rows_done} rows", file=sys.stderr)
+
+    # Drop anything written after the last checkpoint
+    with open(output_path, "ab") as out:
+        out.truncate(checkpoint["output_bytes"])
+
+    start, scored_rows, skip = time.perf_counter(), 0, rows_done
+    with open(output_path, "ab") as out:
+        for chunk in read_chunks(input_path, chunk_size):
+            if skip >= len(chunk):
+                skip -= len(chunk)
+                continue
+            chunk, skip = chunk.iloc[skip:], 0
+
+            if text_column not in chunk.columns:
+                available = list(chunk.columns)
+                raise KeyError(f"Column '{text_column}' not found in {available}")
+
+            scored = score_chunk(chunk, text_column, predict_proba, batch_size)
+            out.write(serialize_chunk(scored, output_format, header=out.tell() == 0))
+            out.flush()
+            os.fsync(out.fileno())
+
+            rows_done += len(chunk)
+            scored_rows += len(chunk)
+            save_checkpoint(
+                checkpoint_path,
+                {
+                    "rows_done": rows_done,
+                    "output_bytes": out.tell(),
+                    "source": source,
+                },
+            )
+
+            rate = scored_rows / (time.perf_counter() - start)
+            print(
+                f"\rScored {rows_done:,} rows ({rate:,.0f} rows/s)",
+                end="",
+                file=sys.stderr,
+                flush=True,
+            )
+
+    print(f"\nDone: {rows_done:,} rows written to {output_path}", file=sys.stderr)
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score a CSV/JSONL file")
+    parser.add_argument("input", help="CSV or JSONL file to score")
+    parser.add_argument("output", help="CSV or JSONL file to write")
+    parser.add_argument("--text-column", default="content")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=INFERENCE_BATCH_SIZE)
+    parser.add_argument(
+        "--restart", action="store_true", help="ignore any checkpoint and start over"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=0, help="score with N forked CPU workers"
+    )
+    parser.add_argument("--threads-per-worker", type=int, default=1)
+    args = parser.parse_args()
+
+    pool = None
+    if args.workers:
+        from worker_pool import InferencePool
+
+        pool = InferencePool(args.workers, args.threads_per_worker)
+
+    try:
+        score_file(
+            args.input,
+            args.output,
+            args.text_column,
+            chunk_size=args.chunk_size,
+            batch_size=args.batch_size,
+            restart=args.restart,
+            predict_proba=pool.predict_proba_batch if pool else None,
+        )
+    finally:
+        if pool is not None:
+            pool.close()
+
+
+if __name__ == "__main__":
+    main()
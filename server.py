@@ -0,0 +1,191 @@
+"""
+Micro-batching HTTP inference server.
+
+Requests that arrive close together are merged into a single forward pass by
+async_model.AsyncPredictor. The server is plain asyncio, so it needs no web
+framework.
+
+Usage:
+    python server.py [--host 127.0.0.1] [--port 8000] [--max-batch-size 64]
+                     [--max-wait-ms 5] [--max-queue 1024] [--metrics]
+
+Endpoints:
+    POST /predict  {"text": "..."} or {"texts": ["...", ...]}
+    GET  /health
+    GET  /metrics  Prometheus text format (recorded with --metrics)
+"""
+
+import argparse
+import asyncio
+import json
+from typing import List, Optional, Tuple
+
+import metrics
+from async_model import AsyncPredictor, QueueFull
+from config import INFERENCE_BATCH_SIZE
+
+MAX_BODY_BYTES = 1024 * 1024
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+def _parse_texts(body: bytes) -> Tuple[Optional[List[str]], bool]:
+    """
+    Extract the texts from a request body.
+
+    Returns:
+        Tuple of (texts or None if malformed, whether it was a single text)
+    """
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return None, False
+    if not isinstance(payload, dict):
+        return None, False
+    if isinstance(payload.get("text"), str):
+        return [payload["text"]], True
+    texts = payload.get("texts")
+    if isinstance(texts, list) and all(isinstance(t, str) for t in texts):
+        return texts, False
+    return None, False
+
+
+async def _write_response(writer, status: int, payload, headers=None):
+    if isinstance(payload, str):
+        body = payload.encode("utf-8")
+        content_type = "text/plain; version=0.0.4; charset=utf-8"
+    else:
+        body = json.dumps(payload).encode("utf-8")
+        content_type = "application/json"
+    lines = [
+        f"HTTP/1.1 {status} {REASONS[status]}",
+        f"Content-Type: {content_type}",
+        f"Content-Length: {len(body)}",
+    ]
+    lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+    await writer.drain()
+
+
+async def _handle_request(predictor, method, path, body):
+    """Return (status, payload, extra headers) for one request."""
+    if path == "/health":
+        return 200, {"status": "ok"}, None
+    if path == "/metrics":
+        return 200, metrics.render_prometheus(), None
+    if path != "/predict":
+        return 404, {"error": "not found"}, None
+    if method != "POST":
+        return 405, {"error": "use POST"}, None
+
+    texts, single = _parse_texts(body)
+    if texts is None:
+        return 400, {"error": 'expected {"text": str} or {"texts": [str]}'}, None
+    if len(texts) > predictor.max_in_flight:
+        limit = predictor.max_in_flight
+        return 413, {"error": f"at most {limit} texts per request"}, None
+
+    try:
+        results = await predictor.predict_with_confidence_batch(texts, wait=False)
+    except QueueFull:
+        return 503, {"error": "server busy, retry later"}, {"Retry-After": "1"}
+    except Exception as e:
+        return 500, {"error": str(e)}, None
+
+    predictions = [
+        {"label": label, "confidence": scores} for label, scores in results
+    ]
+    if single:
+        return 200, predictions[0], None
+    return 200, {"predictions": predictions}, None
+
+
+async def handle_connection(predictor, reader, writer):
+    """Serve HTTP/1.1 requests on one keep-alive connection."""
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            method, path, _ = request_line.decode("latin-1").split(" ", 2)
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            length = int(headers.get("content-length", 0))
+            if length > MAX_BODY_BYTES:
+                await _write_response(writer, 413, {"error": "body too large"})
+                break
+            body = await reader.readexactly(length) if length else b""
+
+            status, payload, extra = await _handle_request(
+                predictor, method, path, body
+            )
+            await _write_response(writer, status, payload, extra)
+            if headers.get("connection", "").lower() == "close":
+                break
+    except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(host, port, max_batch_size, max_wait_ms, max_queue):
+    """Load the model, then serve requests until cancelled."""
+    predictor = AsyncPredictor(max_batch_size, max_wait_ms, max_queue)
+    await predictor.warmup()
+
+    server = await asyncio.start_server(
+        lambda r, w: handle_connection(predictor, r, w), host, port
+    )
+    print(f"Serving on http://{host}:{port}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await predictor.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-batching inference server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--max-batch-size", type=int, default=INFERENCE_BATCH_SIZE)
+    parser.add_argument("--max-wait-ms", type=float, default=5.0)
+    parser.add_argument("--max-queue", type=int, default=1024)
+    parser.add_argument(
+        "--metrics", action="store_true", help="Record per-stage inference metrics"
+    )
+    args = parser.parse_args()
+    if args.metrics:
+        metrics.enable()
+
+    try:
+        asyncio.run(
+            serve(
+                args.host,
+                args.port,
+                args.max_batch_size,
+                args.max_wait_ms,
+                args.max_queue,
+            )
+        )
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Small student classifier distilled from the DistilBERT teacher.
+
+A convolutional bag-of-embeddings model over the teacher's WordPiece vocabulary:
+token embeddings feed one convolution, then masked max and mean pooling and
+a small classification head. It is orders of magnitude cheaper than
+DistilBERT and takes the same input_ids / attention_mask inputs.
+"""
+
+import json
+import os
+
+import torch
+from torch import nn
+
+CONFIG_NAME = "student_config.json"
+WEIGHTS_NAME = "student.pt"
+
+
+class StudentClassifier(nn.Module):
+    def __init__(
+        self,
+        vocab_size: int,
+        num_labels: int,
+        dim: int = 128,
+        hidden: int = 256,
+        kernel_size: int = 3,
+        pad_token_id: int = 0,
+    ):
+        super().__init__()
+        self.config = {
+            "vocab_size": vocab_size,
+            "num_labels": num_labels,
+            "dim": dim,
+            "hidden": hidden,
+            "kernel_size": kernel_size,
+            "pad_token_id": pad_token_id,
+        }
+        self.embeddings = nn.Embedding(vocab_size, dim, padding_idx=pad_token_id)
+        self.conv = nn.Conv1d(dim, dim, kernel_size, padding=kernel_size // 2)
+        self.classifier = nn.Sequential(
+            nn.Linear(2 * dim, hidden),
+            nn.ReLU(),
+            nn.Dropout(0.1),
+            nn.Linear(hidden, num_labels),
+        )
+
+    def forward(self, input_ids, attention_mask):
+        """Return class logits of shape (batch, num_labels)."""
+        mask = attention_mask.unsqueeze(-1).to(self.embeddings.weight.dtype)
+        embedded = self.embeddings(input_ids) * mask
+        features = torch.relu(self.conv(embedded.transpose(1, 2))).transpose(1, 2)
+
+        max_pooled = features.masked_fill(mask == 0, float("-inf")).max(dim=1).values
+        mean_pooled = embedded.sum(dim=1) / mask.sum(dim=1).clamp(min=1)
+        return self.classifier(torch.cat([max_pooled, mean_pooled], dim=-1))
+
+
+def save_student(student: StudentClassifier, directory: str):
+    """Write the student's config and weights to ``directory``."""
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, CONFIG_NAME), "w") as f:
+        json.dump(student.config, f, indent=2)
+    torch.save(student.state_dict(), os.path.join(directory, WEIGHTS_NAME))
+
+
+def load_student(directory: str) -> StudentClassifier:
+    """Load a student saved by save_student, in eval mode."""
+    with open(os.path.join(directory, CONFIG_NAME)) as f:
+        config = json.load(f)
+    student = StudentClassifier(**config)
+    state = torch.load(os.path.join(directory, WEIGHTS_NAME), map_location="cpu")
+    student.load_state_dict(state)
+    student.eval()
+    return student
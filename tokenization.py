@@ -0,0 +1,19 @@
+"""Tokenizer loading shared by inference and training."""
+
+from config import USE_FAST_TOKENIZER
+
+
+def load_tokenizer(path: str, use_fast: bool = USE_FAST_TOKENIZER):
+    """
+    Load the DistilBERT tokenizer from ``path``.
+
+    Uses the Rust-backed fast tokenizer when requested and the ``tokenizers``
+    package is installed, and falls back to the pure-Python one otherwise.
+    Both produce identical input ids.
+    """
+    from transformers import DistilBertTokenizer, DistilBertTokenizerFast
+    from transformers.utils import is_tokenizers_available
+
+    if use_fast and is_tokenizers_available():
+        return DistilBertTokenizerFast.from_pretrained(path)
+    return DistilBertTokenizer.from_pretrained(path)
@@ -0,0 +1,80 @@
+"""
+Load the compiled inference artifact written by export_torchscript.py.
+
+The artifact is a traced TorchScript module plus a tokenizers-library
+``tokenizer.json``, so loading it needs neither ``transformers`` nor
+``from_pretrained``.
+"""
+
+import json
+import os
+from typing import Dict, List, Union
+
+import torch
+
+MODEL_NAME = "model.pt"
+TOKENIZER_NAME = "tokenizer.json"
+INFO_NAME = "export_info.json"
+
+
+class TokenizerFile:
+    """
+    Minimal stand-in for a HuggingFace tokenizer backed by ``tokenizer.json``.
+
+    Supports the calls model.py makes: batch encoding, optionally truncated
+    and without special tokens, returning unpadded input ids, plus the
+    special token ids.
+    """
+
+    def __init__(self, path: str):
+        from tokenizers import Tokenizer
+
+        self._tokenizer = Tokenizer.from_file(path)
+        self._tokenizer.no_padding()
+        self._tokenizer.no_truncation()
+        # One truncating copy per max_length, so calls never mutate shared state
+        self._truncating = {}
+        self.pad_token_id = self._tokenizer.token_to_id("[PAD]")
+        self.cls_token_id = self._tokenizer.token_to_id("[CLS]")
+        self.sep_token_id = self._tokenizer.token_to_id("[SEP]")
+
+    def __len__(self) -> int:
+        return self._tokenizer.get_vocab_size()
+
+    def _with_truncation(self, max_length: int):
+        tokenizer = self._truncating.get(max_length)
+        if tokenizer is None:
+            from tokenizers import Tokenizer
+
+            tokenizer = Tokenizer.from_str(self._tokenizer.to_str())
+            tokenizer.enable_truncation(max_length)
+            self._truncating[max_length] = tokenizer
+        return tokenizer
+
+    def __call__(
+        self,
+        texts: Union[str, List[str]],
+        truncation: bool = False,
+        max_length: int = None,
+        add_special_tokens: bool = True,
+    ) -> Dict[str, List]:
+        tokenizer = self._tokenizer
+        if truncation and max_length is not None:
+            tokenizer = self._with_truncation(max_length)
+
+        single = isinstance(texts, str)
+        encodings = tokenizer.encode_batch(
+            [texts] if single else texts, add_special_tokens=add_special_tokens
+        )
+        input_ids = [encoding.ids for encoding in encodings]
+        return {"input_ids": input_ids[0] if single else input_ids}
+
+
+def load_artifact(directory: str, device: torch.device):
+    """Return (scripted model, tokenizer, export info) from ``directory``."""
+    with open(os.path.join(directory, INFO_NAME)) as f:
+        info = json.load(f)
+    module = torch.jit.load(os.path.join(directory, MODEL_NAME), map_location=device)
+    module.eval()
+    tokenizer = TokenizerFile(os.path.join(directory, TOKENIZER_NAME))
+    return module, tokenizer, info
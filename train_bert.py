@@ -17,13 +17,16 @@ import pandas as pd
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import classification_report, accuracy_score, f1_score
 from transformers import (
-    DistilBertTokenizer,
     DistilBertForSequenceClassification,
     Trainer,
     TrainingArguments,
     EarlyStoppingCallback,
+    DataCollatorWithPadding,
 )
-from datasets import Dataset
+from torch.utils.data import Dataset
+
+from corpus_cache import load_tokenized_corpus
+from tokenization import load_tokenizer
 
 from config import (
     MODEL_NAME,
@@ -68,23 +71,52 @@ def load_data():
     return df
 
 
-def tokenize_dataset(df, tokenizer):
-    """Tokenize the dataset for BERT."""
-    dataset = Dataset.from_pandas(df[["content", "label"]])
+def split_data(df):
+    """
+    Split into (train_df, val_df), 80/20 stratified by label.
+
+    The validation rows are never trained on, so scripts that evaluate the
+    trained model (distill.py, the benchmarks) reuse this split.
+    """
+    return train_test_split(df, test_size=0.2, random_state=42, stratify=df["label"])
+
 
-    def tokenize_function(examples):
-        return tokenizer(
-            examples["content"],
-            padding="max_length",
-            truncation=True,
-            max_length=MAX_LENGTH,
-        )
+class TokenizedDataset(Dataset):
+    """Unpadded examples backed by the memory-mapped token cache."""
 
-    tokenized = dataset.map(tokenize_function, batched=True)
-    tokenized = tokenized.rename_column("label", "labels")
-    tokenized.set_format("torch", columns=["input_ids", "attention_mask", "labels"])
+    def __init__(self, input_ids, offsets, labels):
+        self.input_ids = input_ids
+        self.offsets = offsets
+        self.labels = labels
 
-    return tokenized
+    def __len__(self):
+        return len(self.labels)
+
+    def __getitem__(self, idx):
+        start, end = int(self.offsets[idx]), int(self.offsets[idx + 1])
+        input_ids = self.input_ids[start:end].tolist()
+        return {
+            "input_ids": input_ids,
+            "attention_mask": [1] * len(input_ids),
+            "labels": int(self.labels[idx]),
+        }
+
+
+def tokenize_dataset(df, tokenizer):
+    """Tokenize the dataset for BERT, reusing the on-disk token cache."""
+    input_ids, offsets = load_tokenized_corpus(
+        df["content"].astype(str).tolist(), tokenizer, MAX_LENGTH
+    )
+    return TokenizedDataset(input_ids, offsets, df["label"].to_numpy())
+
+
+def make_collator(tokenizer, dynamic_padding=True):
+    """Pad each batch to its longest example, or to MAX_LENGTH if not dynamic."""
+    if dynamic_padding:
+        return DataCollatorWithPadding(tokenizer, padding="longest")
+    return DataCollatorWithPadding(
+        tokenizer, padding="max_length", max_length=MAX_LENGTH
+    )
 
 
 def compute_metrics(eval_pred):
@@ -107,14 +139,12 @@ def train():
     df = load_data()
 
     # Split data
-    train_df, val_df = train_test_split(
-        df, test_size=0.2, random_state=42, stratify=df["label"]
-    )
+    train_df, val_df = split_data(df)
     print(f"Train size: {len(train_df)}, Validation size: {len(val_df)}")
 
     # Initialize tokenizer
     print(f"Loading tokenizer: {MODEL_NAME}...")
-    tokenizer = DistilBertTokenizer.from_pretrained(MODEL_NAME)
+    tokenizer = load_tokenizer(MODEL_NAME)
 
     # Tokenize datasets
     print("Tokenizing datasets...")
@@ -151,6 +181,10 @@ def train():
         metric_for_best_model="f1_macro",
         greater_is_better=True,
         fp16=torch.cuda.is_available(),
+        # Batch examples of similar length together to minimise padding
+        group_by_length=True,
+        # model.py memory-maps model.safetensors; never write pickled weights
+        save_safetensors=True,
         report_to="none",
     )
 
@@ -160,6 +194,7 @@ def train():
         args=training_args,
         train_dataset=train_dataset,
         eval_dataset=val_dataset,
+        data_collator=make_collator(tokenizer),
         compute_metrics=compute_metrics,
         callbacks=[EarlyStoppingCallback(early_stopping_patience=2)],
     )
@@ -172,6 +207,10 @@ def train():
     print(f"\nSaving model to {MODEL_DIR}...")
     trainer.save_model(MODEL_DIR)
     tokenizer.save_pretrained(MODEL_DIR)
+    # Drop pickled weights left by older runs so nothing loads stale files
+    stale_weights = os.path.join(MODEL_DIR, "pytorch_model.bin")
+    if os.path.exists(stale_weights):
+        os.remove(stale_weights)
 
     # Final evaluation
     print("\nFinal Evaluation:")
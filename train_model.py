@@ -1,3 +1,6 @@
+import shutil
+import tempfile
+
 import pandas as pd
 from sklearn.model_selection import train_test_split, GridSearchCV
 from sklearn.feature_extraction.text import TfidfVectorizer
@@ -5,18 +8,31 @@ from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import classification_report, confusion_matrix
 from sklearn.pipeline import Pipeline
 import joblib
-from preprocess import clean_text
+from corpus_cache import load_clean_corpus
 
+PARAM_GRID = {
+    "tfidf__ngram_range": [(1, 1), (1, 2)],
+    "tfidf__max_df": [0.75, 0.85, 1.0],
+    "clf__C": [0.1, 1, 10],
+    "clf__penalty": ["l2"],
+}
 
-def main():
+
+def load_split():
     df = pd.read_csv("text_emotions.csv")
-    X = df["content"].apply(clean_text)
+    X = pd.Series(
+        load_clean_corpus("text_emotions.csv", "content", texts=df["content"]),
+        index=df.index,
+        name="content",
+    )
     y = df["sentiment"]
 
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=0.3, random_state=0
-    )
+    return train_test_split(X, y, test_size=0.3, random_state=0)
+
 
+def build_search(memory=None, n_jobs=-1, verbose=2):
+    # With a memory directory, the fitted TF-IDF step is cached per fold and
+    # TF-IDF setting, so candidates differing only in clf__* reuse it.
     model = Pipeline(
         [
             (
@@ -31,21 +47,26 @@ def main():
                     solver="liblinear", class_weight="balanced", max_iter=1000
                 ),
             ),
-        ]
+        ],
+        memory=memory,
     )
 
-    param_grid = {
-        "tfidf__ngram_range": [(1, 1), (1, 2)],
-        "tfidf__max_df": [0.75, 0.85, 1.0],
-        "clf__C": [0.1, 1, 10],
-        "clf__penalty": ["l2"],
-    }
-
-    grid = GridSearchCV(
-        model, param_grid, cv=5, scoring="f1_macro", n_jobs=-1, verbose=2
+    return GridSearchCV(
+        model, PARAM_GRID, cv=5, scoring="f1_macro", n_jobs=n_jobs, verbose=verbose
     )
-    grid.fit(X_train, y_train)
+
+
+def main():
+    X_train, X_test, y_train, y_test = load_split()
+
+    cache_dir = tempfile.mkdtemp(prefix="tfidf-cache-")
+    try:
+        grid = build_search(memory=cache_dir)
+        grid.fit(X_train, y_train)
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
     model = grid.best_estimator_
+    model.set_params(memory=None)
 
     y_pred = model.predict(X_test)
 
@@ -0,0 +1,222 @@
+"""
+Out-of-core trainer for the classical emotion model.
+
+Streams the labelled CSV through spaCy once, with a single worker pool, and
+spools the cleaned rows to temporary files. Each epoch then reads the
+cleaned training rows in chunks, hashes them into a fixed-size sparse
+feature space and updates an SGD logistic regression with partial_fit.
+Memory stays bounded by the chunk size and the number of hash features,
+however large the corpus is. Classes are weighted like
+class_weight="balanced" through per-row sample weights. The saved pipeline
+takes cleaned text, like best_model.pkl, so it is a drop-in replacement.
+
+Usage:
+    python train_streaming.py [--data text_emotions.csv]
+                              [--output streaming_model.pkl]
+                              [--chunk-size 10000] [--epochs 3]
+                              [--n-process -1]
+"""
+
+import argparse
+import csv
+import os
+import tempfile
+import zlib
+from collections import Counter, deque
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.linear_model import SGDClassifier
+from sklearn.metrics import classification_report
+from sklearn.pipeline import Pipeline
+
+from preprocess import clean_texts
+
+
+def is_test_row(text: str, test_fraction: float) -> bool:
+    """Deterministically hold out a fraction of rows, based on their text."""
+    return zlib.crc32(text.encode("utf-8")) % 1000 < test_fraction * 1000
+
+
+def iter_chunks(path, text_column, label_column, chunk_size):
+    """Yield (texts, labels) chunks with empty rows dropped."""
+    for chunk in pd.read_csv(
+        path, usecols=[text_column, label_column], chunksize=chunk_size
+    ):
+        chunk = chunk.dropna()
+        yield chunk[text_column].astype(str).tolist(), chunk[label_column].tolist()
+
+
+def clean_to_files(
+    path,
+    text_column,
+    label_column,
+    chunk_size,
+    test_fraction,
+    train_path,
+    test_path,
+    n_process=-1,
+):
+    """
+    Clean every row once and write (label, cleaned text) rows to two CSVs.
+
+    All rows go through one clean_texts call, so spaCy starts its worker
+    pool once rather than once per chunk. Returns the per-class counts of
+    the training rows and the set of all labels.
+    """
+    # Labels wait here, in order, until spaCy returns the matching text
+    pending = deque()
+
+    def texts():
+        for chunk_texts, labels in iter_chunks(
+            path, text_column, label_column, chunk_size
+        ):
+            for text, label in zip(chunk_texts, labels):
+                pending.append((str(label), is_test_row(text, test_fraction)))
+                yield text
+
+    train_counts, labels = Counter(), set()
+    with open(train_path, "w", newline="", encoding="utf-8") as train_file, open(
+        test_path, "w", newline="", encoding="utf-8"
+    ) as test_file:
+        writers = csv.writer(train_file), csv.writer(test_file)
+        for cleaned in clean_texts(texts(), n_process=n_process):
+            label, is_test = pending.popleft()
+            writers[is_test].writerow([label, cleaned])
+            labels.add(label)
+            if not is_test:
+                train_counts[label] += 1
+    return train_counts, labels
+
+
+def iter_cleaned(path, chunk_size):
+    """Yield (cleaned texts, labels) chunks from a clean_to_files CSV."""
+    if os.path.getsize(path) == 0:
+        return
+    for chunk in pd.read_csv(
+        path,
+        names=["label", "text"],
+        dtype=str,
+        keep_default_na=False,
+        chunksize=chunk_size,
+    ):
+        yield chunk["text"].tolist(), chunk["label"].tolist()
+
+
+def balanced_weights(counts):
+    """Per-class weights matching scikit-learn's class_weight="balanced"."""
+    total = sum(counts.values())
+    return {label: total / (len(counts) * count) for label, count in counts.items()}
+
+
+def build_pipeline(n_features):
+    return Pipeline(
+        [
+            (
+                "hash",
+                HashingVectorizer(
+                    ngram_range=(1, 2),
+                    n_features=n_features,
+                    alternate_sign=False,
+                    norm="l2",
+                ),
+            ),
+            (
+                "clf",
+                SGDClassifier(loss="log_loss", alpha=1e-5, random_state=0),
+            ),
+        ]
+    )
+
+
+def train(
+    path,
+    output,
+    text_column="content",
+    label_column="sentiment",
+    chunk_size=10000,
+    epochs=3,
+    n_features=2**20,
+    test_fraction=0.1,
+    n_process=-1,
+):
+    model = build_pipeline(n_features)
+    vectorizer, clf = model.named_steps["hash"], model.named_steps["clf"]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        train_path = os.path.join(tmp_dir, "train.csv")
+        test_path = os.path.join(tmp_dir, "test.csv")
+        print("Cleaning corpus...")
+        train_counts, labels = clean_to_files(
+            path,
+            text_column,
+            label_column,
+            chunk_size,
+            test_fraction,
+            train_path,
+            test_path,
+            n_process,
+        )
+        if not train_counts:
+            raise ValueError(f"No training rows in {path}")
+        classes = np.array(sorted(labels))
+        weights = balanced_weights(train_counts)
+        print(f"Classes: {list(classes)}")
+
+        for epoch in range(epochs):
+            rows = 0
+            for texts, chunk_labels in iter_cleaned(train_path, chunk_size):
+                clf.partial_fit(
+                    vectorizer.transform(texts),
+                    chunk_labels,
+                    classes=classes,
+                    sample_weight=[weights[label] for label in chunk_labels],
+                )
+                rows += len(texts)
+            print(f"Epoch {epoch + 1}/{epochs}: trained on {rows} rows")
+
+        y_true, y_pred = [], []
+        for texts, chunk_labels in iter_cleaned(test_path, chunk_size):
+            y_true.extend(chunk_labels)
+            y_pred.extend(model.predict(texts))
+
+    if y_true:
+        print(classification_report(y_true, y_pred))
+
+    joblib.dump(model, output)
+    print(f"Saved model to {output}")
+    return model
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Out-of-core classical trainer")
+    parser.add_argument("--data", default="text_emotions.csv")
+    parser.add_argument("--output", default="streaming_model.pkl")
+    parser.add_argument("--text-column", default="content")
+    parser.add_argument("--label-column", default="sentiment")
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    parser.add_argument("--epochs", type=int, default=3)
+    parser.add_argument("--n-features", type=int, default=2**20)
+    parser.add_argument("--test-fraction", type=float, default=0.1)
+    parser.add_argument(
+        "--n-process", type=int, default=-1, help="spaCy worker processes"
+    )
+    args = parser.parse_args()
+
+    train(
+        args.data,
+        args.output,
+        text_column=args.text_column,
+        label_column=args.label_column,
+        chunk_size=args.chunk_size,
+        epochs=args.epochs,
+        n_features=args.n_features,
+        test_fraction=args.test_fraction,
+        n_process=args.n_process,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Pick cascade thresholds that reach a target macro-F1 at the lowest cost.
+
+Both models score rows that neither of them trained on: texts in
+train_model.py's 30% test split (random_state=0) that are absent from both
+train_model.py's training split and train_bert.py's training split. The
+per-text cost of each stage is measured, and then every
+(min_confidence, min_margin) pair in the grid is simulated offline.
+Tuning on rows DistilBERT had seen would make escalation look better than it
+is and bias the thresholds towards it.
+
+Macro-F1 averages over the classes present in the held-out labels only.
+text_emotions.csv has no "neutral" rows, but DistilBERT can predict
+"neutral". Such predictions still count as errors for the true class. They
+do not add a seventh class with F1 = 0, which would penalize every setting
+that escalates.
+
+Usage:
+    python tune_cascade.py [--target-f1 0.85] [--rows 3000]
+
+Set the chosen values through EMOTION_CASCADE_MIN_CONFIDENCE and
+EMOTION_CASCADE_MIN_MARGIN.
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import f1_score
+from sklearn.model_selection import train_test_split
+
+from cascade import LinearModel, is_confident
+from config import EMOTIONS, ORIGINAL_DATA_PATH
+
+CONFIDENCE_GRID = [round(x, 2) for x in np.arange(0.0, 1.0, 0.05)] + [1.01]
+MARGIN_GRID = [0.0, 0.1, 0.2, 0.3, 0.5]
+
+
+def held_out_split(rows):
+    """Return (texts, labels) held out from both the linear model and DistilBERT."""
+    from train_bert import load_data, split_data
+
+    df = pd.read_csv(ORIGINAL_DATA_PATH)
+    linear_train, test_df = train_test_split(df, test_size=0.3, random_state=0)
+    bert_train, _ = split_data(load_data())
+
+    seen = set(linear_train["content"].astype(str))
+    seen.update(bert_train["content"].astype(str))
+    test_df = test_df[~test_df["content"].astype(str).isin(seen)].head(rows)
+    return test_df["content"].astype(str).tolist(), test_df["sentiment"].tolist()
+
+
+def macro_f1(labels, predictions):
+    """Macro-F1 over the classes that occur in ``labels``."""
+    return f1_score(labels, predictions, labels=sorted(set(labels)), average="macro")
+
+
+def argmax_labels(rows):
+    return [EMOTIONS[int(np.argmax(row))] for row in rows]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tune the cascade thresholds")
+    parser.add_argument("--target-f1", type=float, default=0.85)
+    parser.add_argument("--rows", type=int, default=3000)
+    args = parser.parse_args()
+
+    import model
+
+    texts, labels = held_out_split(args.rows)
+
+    linear = LinearModel()
+    start = time.perf_counter()
+    linear_rows = linear.predict_proba_batch(texts)
+    linear_cost = (time.perf_counter() - start) / len(texts)
+
+    model._load_model()
+    start = time.perf_counter()
+    transformer_rows = model._score_cleaned(
+        [model._minimal_clean(text) for text in texts], model.INFERENCE_BATCH_SIZE
+    )
+    transformer_cost = (time.perf_counter() - start) / len(texts)
+
+    linear_labels = argmax_labels(linear_rows)
+    transformer_labels = argmax_labels(transformer_rows)
+    print(f"Held-out texts: {len(texts)}")
+    print(f"Linear:      {1000 * linear_cost:.3f} ms/text, macro-F1 "
+          f"{macro_f1(labels, linear_labels):.4f}")
+    print(f"DistilBERT:  {1000 * transformer_cost:.3f} ms/text, macro-F1 "
+          f"{macro_f1(labels, transformer_labels):.4f}")
+
+    candidates = []
+    for min_confidence in CONFIDENCE_GRID:
+        for min_margin in MARGIN_GRID:
+            escalate = [
+                not is_confident(row, min_confidence, min_margin)
+                for row in linear_rows
+            ]
+            predictions = [
+                transformer_labels[i] if escalate[i] else linear_labels[i]
+                for i in range(len(texts))
+            ]
+            fraction = sum(escalate) / len(texts)
+            candidates.append(
+                {
+                    "min_confidence": min_confidence,
+                    "min_margin": min_margin,
+                    "macro_f1": macro_f1(labels, predictions),
+                    "transformer_fraction": fraction,
+                    "cost_ms": 1000 * (linear_cost + fraction * transformer_cost),
+                }
+            )
+
+    meeting = [c for c in candidates if c["macro_f1"] >= args.target_f1]
+    if meeting:
+        best = min(meeting, key=lambda c: (c["cost_ms"], -c["macro_f1"]))
+        print(f"\nCheapest setting with macro-F1 >= {args.target_f1}:")
+    else:
+        best = max(candidates, key=lambda c: (c["macro_f1"], -c["cost_ms"]))
+        print(f"\nNo setting reaches macro-F1 {args.target_f1}; best available:")
+
+    print(f"  EMOTION_CASCADE_MIN_CONFIDENCE={best['min_confidence']}")
+    print(f"  EMOTION_CASCADE_MIN_MARGIN={best['min_margin']}")
+    print(f"  macro-F1 {best['macro_f1']:.4f}, "
+          f"{100 * best['transformer_fraction']:.1f}% sent to DistilBERT, "
+          f"{best['cost_ms']:.3f} ms/text "
+          f"({transformer_cost * 1000 / best['cost_ms']:.1f}x cheaper than DistilBERT)")
+
+
+if __name__ == "__main__":
+    main()
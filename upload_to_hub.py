@@ -13,6 +13,16 @@ import os
 REPO_ID = "xploit007/emotion-detection-distilbert"
 MODEL_DIR = "models/emotion_distilbert"
 
+# Only the files inference needs; checkpoints, logs and pickles stay local
+UPLOAD_PATTERNS = [
+    "model.safetensors",
+    "config.json",
+    "tokenizer.json",
+    "tokenizer_config.json",
+    "special_tokens_map.json",
+    "vocab.txt",
+]
+
 def upload_model():
     """Upload model to HuggingFace Hub."""
     api = HfApi()
@@ -30,14 +40,17 @@ def upload_model():
         folder_path=MODEL_DIR,
         repo_id=REPO_ID,
         repo_type="model",
+        allow_patterns=UPLOAD_PATTERNS,
+        # Remove pickled weights published by earlier uploads
+        delete_patterns=["*.bin", "*.pt", "*.pth"],
     )
 
     print(f"\nModel uploaded successfully!")
     print(f"View at: https://huggingface.co/{REPO_ID}")
 
 if __name__ == "__main__":
-    if not os.path.exists(MODEL_DIR):
-        print(f"Error: Model directory '{MODEL_DIR}' not found.")
+    if not os.path.exists(os.path.join(MODEL_DIR, "model.safetensors")):
+        print(f"Error: No model.safetensors in '{MODEL_DIR}'.")
         print("Run 'python train_bert.py' first to train the model.")
     else:
         upload_model()
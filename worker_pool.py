@@ -0,0 +1,106 @@
+"""
+Multi-process CPU inference with a single in-memory copy of the weights.
+
+The parent process loads the model once, moves its weights into shared
+memory (unless they are already memory-mapped from model.safetensors) and
+then forks the workers, so every worker scores with the same physical copy
+of the weights instead of loading its own.
+
+Example:
+    with InferencePool(workers=4, threads_per_worker=2) as pool:
+        results = pool.predict_with_confidence_batch(texts)
+"""
+
+import math
+import multiprocessing
+import os
+from typing import Dict, List, Sequence, Tuple
+
+import torch
+
+import model
+from config import INFERENCE_BATCH_SIZE, LENGTH_BUCKET_SIZE
+
+
+def _init_worker(threads_per_worker: int):
+    """Limit each worker's intra-op threads so workers do not oversubscribe."""
+    torch.set_num_threads(threads_per_worker)
+
+
+def _score_chunk(args) -> List[List[float]]:
+    texts, batch_size = args
+    return model.predict_proba_batch(texts, batch_size)
+
+
+class InferencePool:
+    """
+    Pool of forked worker processes sharing one copy of the model weights.
+
+    Args:
+        workers: Number of worker processes (defaults to one per CPU)
+        threads_per_worker: torch intra-op threads in each worker
+    """
+
+    def __init__(self, workers: int = None, threads_per_worker: int = 1):
+        self.workers = workers or os.cpu_count() or 1
+        self.threads_per_worker = threads_per_worker
+
+        model._load_model()
+        if model._device.type != "cpu":
+            raise RuntimeError("InferencePool only supports CPU inference")
+        # Memory-mapped weights are already shared through the page cache
+        if not model._weights_mapped:
+            model._model.share_memory()
+
+        # Forked workers must not reuse the parent's tokenizer thread pool
+        os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+        context = multiprocessing.get_context("fork")
+        self._pool = context.Pool(
+            self.workers, initializer=_init_worker, initargs=(threads_per_worker,)
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Stop the workers."""
+        self._pool.close()
+        self._pool.join()
+
+    def predict_proba_batch(
+        self, texts: Sequence[str], batch_size: int = INFERENCE_BATCH_SIZE
+    ) -> List[List[float]]:
+        """Like model.predict_proba_batch, spread across the workers."""
+        texts = list(texts)
+        chunk_size = min(
+            LENGTH_BUCKET_SIZE,
+            max(batch_size, math.ceil(len(texts) / self.workers)),
+        )
+        chunks = (
+            (texts[start : start + chunk_size], batch_size)
+            for start in range(0, len(texts), chunk_size)
+        )
+        results = []
+        for chunk_result in self._pool.imap(_score_chunk, chunks):
+            results.extend(chunk_result)
+        return results
+
+    def predict_with_confidence_batch(
+        self, texts: Sequence[str], batch_size: int = INFERENCE_BATCH_SIZE
+    ) -> List[Tuple[str, Dict[str, float]]]:
+        """Like model.predict_with_confidence_batch, spread across the workers."""
+        return [
+            model._to_confidence(row)
+            for row in self.predict_proba_batch(texts, batch_size)
+        ]
+
+    def predict_batch(
+        self, texts: Sequence[str], batch_size: int = INFERENCE_BATCH_SIZE
+    ) -> List[str]:
+        """Like model.predict_batch, spread across the workers."""
+        return [
+            label for label, _ in self.predict_with_confidence_batch(texts, batch_size)
+        ]